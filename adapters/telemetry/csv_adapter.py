@@ -2,35 +2,125 @@ from __future__ import annotations
 
 import csv
 import json
-from dataclasses import dataclass
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import compress
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+QUERY_CACHE_SIZE = 256
+DATASET_CACHE_SIZE = 4  # parsed file versions shared across adapter instances
+READ_BUFFER_BYTES = 1 << 20  # 1 MiB: fewer read() syscalls on multi-MB telemetry files
 
-def _parse_iso(ts: str) -> datetime:
+_UTC = timezone.utc
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+
+
+def _to_float(raw: Optional[str]) -> Optional[float]:
+    if raw is None or raw == "":
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+def _to_status(raw: Optional[str]) -> Optional[str]:
+    # status is string enum
+    if raw is None or raw == "":
+        return None
+    return str(raw).strip()
+
+
+# Per-signal coercion, resolved once per column instead of per (row, signal)
+_COERCERS = {
+    "soc": _to_float,
+    "soh": _to_float,
+    "temperature": _to_float,
+    "power": _to_float,
+    "status": _to_status,
+}
+
+SUPPORTED_SIGNALS = tuple(_COERCERS)
+
+# events.csv fields, in the order event records are stored after load
+_EVENT_FIELDS = ("event_id", "asset_id", "event_type", "start_ts", "end_ts", "severity", "notes")
+
+
+def _read_csv(path: Path) -> Tuple[Dict[str, int], List[List[str]]]:
+    """
+    Reads a CSV as (header index, rows) using csv.reader: rows stay plain lists
+    instead of one dict per row. Blank lines are skipped, as csv.DictReader does.
+    """
+    with path.open("r", encoding="utf-8", newline="", buffering=READ_BUFFER_BYTES) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = [r for r in reader if r]
+    return {name: i for i, name in enumerate(header)}, rows
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    # (mtime_ns, size) identifies a file version; None if the file is absent
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _column(rows: List[List[str]], idx: Dict[str, int], name: str) -> List[Optional[str]]:
+    # Absent columns and short rows read as None (csv.DictReader semantics)
+    i = idx.get(name)
+    if i is None:
+        return [None] * len(rows)
+    return [r[i] if i < len(r) else None for r in rows]
+
+
+@lru_cache(maxsize=1 << 16)
+def parse_iso(ts: str) -> datetime:
     # Accepts ISO strings with timezone; falls back to UTC if missing.
-    dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt
+    # Cached: telemetry repeats the same timestamps across assets, and
+    # datetimes are immutable so sharing the parsed value is safe.
+    # Public so intents parse boundary strings the same way the adapter does.
+    if ts.endswith("Z"):
+        ts = ts[:-1] + "+00:00"
+    dt = datetime.fromisoformat(ts)
+    return dt if dt.tzinfo else dt.replace(tzinfo=_UTC)
+
 
+def _window_payload(time_window: Optional["TimeWindow"]) -> Optional[Dict[str, str]]:
+    if time_window is None:
+        return None
+    return {"start": time_window.start.isoformat(), "end": time_window.end.isoformat()}
 
-def _in_window(ts: datetime, window: Optional[Tuple[datetime, datetime]]) -> bool:
-    if window is None:
-        return True
-    start, end = window
-    return start <= ts < end
 
+def to_epoch_ns(dt: datetime) -> int:
+    # Exact integer nanoseconds since the Unix epoch (tz-aware input).
+    delta = dt - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
 
-@dataclass
+
+@dataclass(slots=True)
 class TimeWindow:
     start: datetime
     end: datetime
+    # Epoch-ns bounds, derived once so queries compare plain ints
+    start_ns: int = field(init=False, repr=False, compare=False)
+    end_ns: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.start_ns = to_epoch_ns(self.start)
+        self.end_ns = to_epoch_ns(self.end)
 
     @staticmethod
     def from_iso(start_iso: str, end_iso: str) -> "TimeWindow":
-        return TimeWindow(start=_parse_iso(start_iso), end=_parse_iso(end_iso))
+        return TimeWindow(start=parse_iso(start_iso), end=parse_iso(end_iso))
 
     def as_tuple(self) -> Tuple[datetime, datetime]:
         return (self.start, self.end)
@@ -46,9 +136,13 @@ class CsvTelemetryAdapter:
       - synthetic_data/generated/v0/events.csv
 
     This adapter is intentionally simple:
-      - loads files on init
+      - loads files on init (timestamps parsed and signals coerced once, into columns)
       - performs in-memory filtering
       - returns normalized dict structures
+
+    Parsed files are cached per (path, mtime, size), so adapters over the same
+    dataset share one parse. Each query re-stats the files and reloads if
+    either changed on disk.
     """
 
     def __init__(self, base_dir: str | Path = "synthetic_data/generated/v0") -> None:
@@ -59,8 +153,10 @@ class CsvTelemetryAdapter:
 
         self._assets_doc = self._load_assets()
         self._asset_index = self._index_assets(self._assets_doc)
-        self._telemetry_rows = self._load_telemetry()
-        self._events_rows = self._load_events()
+
+        self._stamps: Optional[Tuple[Any, Any]] = None
+        self._reload_lock = threading.Lock()
+        self._refresh()
 
     # -------------------------
     # Public Contract Methods
@@ -90,42 +186,23 @@ class CsvTelemetryAdapter:
             },
         }
 
+    def data_version(self) -> Tuple[Any, Any]:
+        """
+        Opaque token for the telemetry/events file versions currently served
+        (reloading first if a file changed). Equal tokens mean equal data, so
+        callers can key derived caches on it.
+        """
+        self._refresh()
+        return self._stamps
+
     def get_events(self, asset_id: str, time_window: Optional[TimeWindow] = None) -> List[Dict[str, Any]]:
         """
         Returns events for an asset in a time window.
+        Selections are cached as immutable tuples; each call gets fresh dicts.
         """
-        window = time_window.as_tuple() if time_window else None
-        out: List[Dict[str, Any]] = []
-
-        for e in self._events_rows:
-            if e.get("asset_id") != asset_id:
-                continue
-
-            start_ts = _parse_iso(e["start_ts"])
-            end_ts = _parse_iso(e["end_ts"])
-
-            # Event overlaps window if any part intersects
-            if window is not None:
-                w_start, w_end = window
-                overlaps = not (end_ts <= w_start or start_ts >= w_end)
-                if not overlaps:
-                    continue
-
-            out.append(
-                {
-                    "event_id": e.get("event_id"),
-                    "asset_id": e.get("asset_id"),
-                    "event_type": e.get("event_type"),
-                    "start_ts": start_ts.isoformat(),
-                    "end_ts": end_ts.isoformat(),
-                    "severity": e.get("severity"),
-                    "notes": e.get("notes", ""),
-                }
-            )
-
-        # sort by start time
-        out.sort(key=lambda x: x["start_ts"])
-        return out
+        self._refresh()
+        window = (time_window.start_ns, time_window.end_ns) if time_window else None
+        return [dict(zip(_EVENT_FIELDS, values)) for values in self._cached_events(asset_id, window)]
 
     def get_timeseries(
         self,
@@ -134,9 +211,11 @@ class CsvTelemetryAdapter:
         time_window: Optional[TimeWindow] = None,
         *,
         include_missing: bool = True,
+        raw_datetime: bool = False,
     ) -> Dict[str, Any]:
         """
         Returns normalized time-series rows for given asset_id and signals.
+        Row-per-dict view over get_timeseries_arrays' columnar selection.
 
         Output shape:
         {
@@ -152,55 +231,170 @@ class CsvTelemetryAdapter:
         Notes:
         - Always includes `timestamp` and `data_quality_flag`
         - Missing rows are returned as None values if include_missing=True
+        - raw_datetime=True returns `timestamp` as the parsed tz-aware datetime
+          instead of an ISO string (saves callers from re-parsing it)
+        - Rows are cached per (asset_id, signals, window, include_missing) as
+          immutable value tuples; each call gets its own row dicts
         """
-        allowed = {"soc", "soh", "temperature", "power", "status"}
-        bad = [s for s in signals if s not in allowed]
+        bad = [s for s in signals if s not in SUPPORTED_SIGNALS]
         if bad:
-            raise ValueError(f"Unsupported signals: {bad}. Allowed: {sorted(allowed)}")
-
-        window = time_window.as_tuple() if time_window else None
-        rows: List[Dict[str, Any]] = []
+            raise ValueError(f"Unsupported signals: {bad}. Allowed: {sorted(SUPPORTED_SIGNALS)}")
 
-        for r in self._telemetry_rows:
-            if r.get("asset_id") != asset_id:
-                continue
+        self._refresh()
+        window = (time_window.start_ns, time_window.end_ns) if time_window else None
+        values = self._cached_rows(asset_id, tuple(signals), window, include_missing, raw_datetime)
 
-            ts = _parse_iso(r["timestamp"])
-            if not _in_window(ts, window):
-                continue
-
-            dq = (r.get("data_quality_flag") or "ok").strip()
+        names = ("timestamp", "data_quality_flag", *signals)
+        return {
+            "asset_id": asset_id,
+            "signals": signals,
+            "time_window": _window_payload(time_window),
+            "rows": [dict(zip(names, row)) for row in values],
+            "row_count": len(values),
+        }
 
-            # If row is marked missing, either skip or include placeholders
-            if dq == "missing" and not include_missing:
-                continue
+    def get_timeseries_arrays(
+        self,
+        asset_id: str,
+        signals: List[str],
+        time_window: Optional[TimeWindow] = None,
+        *,
+        include_missing: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Columnar variant of get_timeseries: one sequence per field instead of
+        one dict per row, for callers that reduce over whole signals.
 
-            row: Dict[str, Any] = {
-                "timestamp": ts.isoformat(),
-                "data_quality_flag": dq,
-            }
+        Output shape:
+        {
+          "asset_id": ...,
+          "signals": [...],
+          "time_window": {"start": ..., "end": ...} | None,
+          "columns": {
+             "timestamp": [datetime, ...],        # tz-aware, time-ordered
+             "timestamp_ns": array('q', [...]),   # epoch nanoseconds
+             "data_quality_flag": [...],
+             "<signal>": [value_or_None, ...],
+          },
+          "row_count": N
+        }
 
-            for s in signals:
-                row[s] = self._coerce_value(s, r.get(s), dq)
+        Columns are copied out of the adapter's storage (slices), so callers
+        may keep or mutate them.
+        """
+        bad = [s for s in signals if s not in SUPPORTED_SIGNALS]
+        if bad:
+            raise ValueError(f"Unsupported signals: {bad}. Allowed: {sorted(SUPPORTED_SIGNALS)}")
 
-            rows.append(row)
+        self._refresh()
+        window = (time_window.start_ns, time_window.end_ns) if time_window else None
+        columns = self._select_columns(asset_id, tuple(signals), window, include_missing)
 
         return {
             "asset_id": asset_id,
             "signals": signals,
-            "time_window": (
-                {"start": time_window.start.isoformat(), "end": time_window.end.isoformat()}
-                if time_window
-                else None
-            ),
-            "rows": rows,
-            "row_count": len(rows),
+            "time_window": _window_payload(time_window),
+            "columns": columns,
+            "row_count": len(columns["timestamp"]),
         }
 
+    # -------------------------
+    # Internal Queries (cached per adapter instance)
+    # -------------------------
+
+    def _select_events(
+        self, asset_id: str, window: Optional[Tuple[int, int]]
+    ) -> Tuple[Tuple[Any, ...], ...]:
+        # Value tuples in _EVENT_FIELDS order: safe to share from the cache
+        out: List[Tuple[Any, ...]] = []
+
+        # Events are stored sorted by start time, so output is already ordered
+        for start_ns, end_ns, event in self._events_by_asset.get(asset_id, ()):
+            # Event overlaps window if any part intersects
+            if window is not None:
+                w_start, w_end = window
+                if start_ns >= w_end:
+                    break  # every later event starts after the window too
+                if end_ns <= w_start:
+                    continue
+
+            event_id, aid, event_type, start_ts, end_ts, severity, notes = event
+
+            out.append((event_id, aid, event_type, start_ts.isoformat(), end_ts.isoformat(), severity, notes or ""))
+
+        return tuple(out)
+
+    def _select_columns(
+        self,
+        asset_id: str,
+        signals: Tuple[str, ...],
+        window: Optional[Tuple[int, int]],
+        include_missing: bool,
+    ) -> Dict[str, Any]:
+        names = ("timestamp", "timestamp_ns", "data_quality_flag", *signals)
+
+        cols = self._telemetry_by_asset.get(asset_id)
+        if cols is None:
+            out: Dict[str, Any] = {name: [] for name in names}
+            out["timestamp_ns"] = array("q")
+            return out
+
+        # Rows are time-sorted per asset: locate [start, end) by binary search
+        lo, hi = 0, len(cols["timestamp"])
+        if window is not None:
+            ns_col = cols["timestamp_ns"]
+            lo = bisect_left(ns_col, window[0])
+            hi = bisect_left(ns_col, window[1], lo)
+
+        out = {name: cols[name][lo:hi] for name in names}
+
+        if not include_missing:
+            keep = [dq != "missing" for dq in out["data_quality_flag"]]
+            out = {name: list(compress(col, keep)) for name, col in out.items()}
+            out["timestamp_ns"] = array("q", out["timestamp_ns"])
+
+        return out
+
+    def _select_rows(
+        self,
+        asset_id: str,
+        signals: Tuple[str, ...],
+        window: Optional[Tuple[int, int]],
+        include_missing: bool,
+        raw_datetime: bool,
+    ) -> Tuple[Tuple[Any, ...], ...]:
+        # Row view over the columnar selection: one immutable value tuple per row
+        # (timestamp, data_quality_flag, *signals); get_timeseries builds the dicts.
+        cols = self._select_columns(asset_id, signals, window, include_missing)
+
+        ts_col = cols["timestamp"]
+        if not raw_datetime:
+            ts_col = [ts.isoformat() for ts in ts_col]
+
+        return tuple(zip(ts_col, cols["data_quality_flag"], *(cols[s] for s in signals)))
+
     # -------------------------
     # Internal Loaders
     # -------------------------
 
+    def _refresh(self) -> None:
+        # Cheap stat check per query; reload only when a source file changed
+        stamps = (_file_stamp(self.telemetry_path), _file_stamp(self.events_path))
+        if stamps == self._stamps:
+            return
+        with self._reload_lock:
+            if stamps == self._stamps:
+                return
+            self._telemetry_by_asset = self._load_telemetry(self.telemetry_path.resolve(), stamps[0])
+            self._events_by_asset = self._load_events(self.events_path.resolve(), stamps[1])
+
+            # Data is immutable per file version, so query results are memoized
+            # (intents re-request the same windows). New data gets new caches;
+            # calls already in flight finish against the old ones.
+            self._cached_rows = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._select_rows)
+            self._cached_events = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._select_events)
+            self._stamps = stamps
+
     def _load_assets(self) -> Dict[str, Any]:
         if not self.assets_path.exists():
             raise FileNotFoundError(f"assets.json not found at: {self.assets_path}")
@@ -213,31 +407,77 @@ class CsvTelemetryAdapter:
                 idx[a["asset_id"]] = a
         return idx
 
-    def _load_telemetry(self) -> List[Dict[str, str]]:
-        if not self.telemetry_path.exists():
-            raise FileNotFoundError(f"telemetry.csv not found at: {self.telemetry_path}")
-        with self.telemetry_path.open("r", encoding="utf-8") as f:
-            return list(csv.DictReader(f))
-
-    def _load_events(self) -> List[Dict[str, str]]:
-        if not self.events_path.exists():
-            raise FileNotFoundError(f"events.csv not found at: {self.events_path}")
-        with self.events_path.open("r", encoding="utf-8") as f:
-            return list(csv.DictReader(f))
-
-    def _coerce_value(self, signal: str, raw: Optional[str], dq: str) -> Any:
-        # Missing row or missing field returns None
-        if dq == "missing" or raw is None or raw == "":
-            return None
-
-        if signal in {"soc", "soh", "temperature", "power"}:
-            try:
-                return float(raw)
-            except ValueError:
-                return None
-
-        # status is string enum
-        if signal == "status":
-            return str(raw).strip() if raw is not None else None
-
-        return raw
+    @staticmethod
+    @lru_cache(maxsize=DATASET_CACHE_SIZE)
+    def _load_telemetry(path: Path, stamp: Optional[Tuple[int, int]]) -> Dict[str, Dict[str, List[Any]]]:
+        """
+        Reads telemetry.csv once into typed columns (one list per field),
+        grouped by asset_id and sorted by timestamp. Alongside the datetime
+        column (used for output), `timestamp_ns` holds epoch-ns ints in an
+        array('q') for window comparisons.
+
+        Timestamps are parsed and signal values coerced here, so queries only
+        filter already-typed values instead of re-parsing strings per call,
+        and can bisect the requested asset's rows for a time window.
+
+        Cached per (path, stamp): `stamp` is the file's (mtime_ns, size), so a
+        changed file is a new key. Callers must not mutate the result.
+        """
+        if stamp is None:
+            raise FileNotFoundError(f"telemetry.csv not found at: {path}")
+        idx, raw = _read_csv(path)
+
+        dq_col = [(v or "ok").strip() for v in _column(raw, idx, "data_quality_flag")]
+        ts_col = [parse_iso(v) for v in _column(raw, idx, "timestamp")]
+        cols: Dict[str, List[Any]] = {
+            "timestamp": ts_col,
+            "timestamp_ns": [to_epoch_ns(ts) for ts in ts_col],
+            "asset_id": _column(raw, idx, "asset_id"),
+            "data_quality_flag": dq_col,
+        }
+        # Missing rows carry None for every signal
+        for s, coerce in _COERCERS.items():
+            cols[s] = [None if dq == "missing" else coerce(v) for v, dq in zip(_column(raw, idx, s), dq_col)]
+
+        positions: Dict[str, List[int]] = defaultdict(list)
+        for i, aid in enumerate(cols.pop("asset_id")):
+            positions[aid].append(i)
+        for idx in positions.values():
+            idx.sort(key=cols["timestamp_ns"].__getitem__)  # stable: ties keep file order
+
+        by_asset: Dict[str, Dict[str, List[Any]]] = {}
+        for aid, idx in positions.items():
+            asset_cols = {name: [col[i] for i in idx] for name, col in cols.items()}
+            asset_cols["timestamp_ns"] = array("q", asset_cols["timestamp_ns"])
+            by_asset[aid] = asset_cols
+        return by_asset
+
+    @staticmethod
+    @lru_cache(maxsize=DATASET_CACHE_SIZE)
+    def _load_events(path: Path, stamp: Optional[Tuple[int, int]]) -> Dict[str, List[Tuple[int, int, Tuple[Any, ...]]]]:
+        """
+        Reads events.csv into per-asset (start_ns, end_ns, event) entries, where
+        event is a tuple ordered as _EVENT_FIELDS, sorted by start time.
+        Dicts are only built for events a query actually returns.
+        Cached per (path, stamp) like _load_telemetry.
+        """
+        if stamp is None:
+            raise FileNotFoundError(f"events.csv not found at: {path}")
+        idx, raw = _read_csv(path)
+
+        # Parse event bounds once; get_events only compares datetimes.
+        by_asset: Dict[str, List[Tuple[int, int, Tuple[Any, ...]]]] = defaultdict(list)
+        for event_id, aid, event_type, start_ts, end_ts, severity, notes in zip(
+            *(_column(raw, idx, name) for name in _EVENT_FIELDS)
+        ):
+            start_dt, end_dt = parse_iso(start_ts), parse_iso(end_ts)
+            by_asset[aid].append(
+                (
+                    to_epoch_ns(start_dt),
+                    to_epoch_ns(end_dt),
+                    (event_id, aid, event_type, start_dt, end_dt, severity, notes),
+                )
+            )
+        for events in by_asset.values():
+            events.sort(key=lambda e: e[0])  # start_ns
+        return dict(by_asset)
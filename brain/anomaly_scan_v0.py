@@ -1,43 +1,57 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from adapters.telemetry import CsvTelemetryAdapter
 from adapters.telemetry.csv_adapter import TimeWindow
 from evidence import EvidenceBuilder
 from brain.contracts import BrainResponse, Confidence
-from brain.confidence_bridge_v1 import score_confidence_v1, gap_stats_from_rows
+from brain.confidence_bridge_v1 import score_confidence_v1, gap_stats_from_flags
+from brain.telemetry_bundle_v0 import fetch_arrays
 
+SPIKE_SAMPLE_CAP = 20  # spike points echoed in `data` (cap for readability)
 
-def _parse_iso(ts: str) -> datetime:
-    dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt
 
-
-def _filter_numeric(rows: List[Dict[str, Any]], key: str) -> List[Tuple[datetime, float, str]]:
-    out: List[Tuple[datetime, float, str]] = []
-    for r in rows:
-        v = r.get(key)
-        if v is None:
-            continue
-        try:
-            out.append((_parse_iso(r["timestamp"]), float(v), r.get("data_quality_flag", "ok")))
-        except Exception:
-            continue
-    out.sort(key=lambda x: x[0])
-    return out
-
-
-def _percentile(values: List[float], p: float) -> Optional[float]:
+def _filter_numeric(
+    timestamps: List[datetime],
+    values: List[Optional[float]],
+    flags: List[str],
+    *,
+    assume_sorted: bool = True,
+) -> Tuple[List[datetime], List[float], List[str]]:
+    # Takes adapter columns (timestamps parsed, values coerced to float or None);
+    # returns parallel lists of the non-null points, time-ordered. Adapter columns
+    # are already time-ordered, so the sort is skipped unless assume_sorted=False.
+    ts_out: List[datetime] = []
+    v_out: List[float] = []
+    dq_out: List[str] = []
+    for t, v, dq in zip(timestamps, values, flags):
+        if v is not None:
+            ts_out.append(t)
+            v_out.append(v)
+            dq_out.append(dq)
+
+    if assume_sorted:
+        if __debug__:
+            assert all(a <= b for a, b in zip(ts_out, ts_out[1:])), "timestamps not time-ordered"
+        return ts_out, v_out, dq_out
+
+    order = sorted(range(len(ts_out)), key=ts_out.__getitem__)  # stable, like sorting tuples by time
+    return [ts_out[i] for i in order], [v_out[i] for i in order], [dq_out[i] for i in order]
+
+
+def _percentiles(values: List[float], ps: Sequence[float]) -> Optional[List[float]]:
+    """
+    Nearest-rank percentiles for several p (0..1) from a single sort.
+    Returns None when there are no values.
+    """
     if not values:
         return None
     vs = sorted(values)
-    k = int(round((len(vs) - 1) * p))
-    return vs[max(0, min(len(vs) - 1, k))]
+    last = len(vs) - 1
+    return [vs[max(0, min(last, int(round(last * p))))] for p in ps]
 
 
 def anomaly_scan_v0(
@@ -47,7 +61,14 @@ def anomaly_scan_v0(
     start_iso: str,
     end_iso: str,
     role: str = "ops",
+    bundle: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> BrainResponse:
+    """
+    Scan one asset's temperature for spikes above a percentile threshold.
+
+    `bundle` (see brain.telemetry_bundle_v0.fetch_bundle) lets a caller that already
+    fetched this window share it instead of querying the adapter again.
+    """
     question = f"Scan {asset_id} for temperature anomalies in the given window."
     intent = "anomaly_scan_temp_v0"
     ev = EvidenceBuilder.start(question, intent, role=role)
@@ -55,10 +76,12 @@ def anomaly_scan_v0(
     tw = TimeWindow.from_iso(start_iso, end_iso)
 
     # Pull telemetry
-    ts = adapter.get_timeseries(asset_id, ["temperature"], tw, include_missing=True)
-    rows = ts["rows"]
+    ts = bundle.get(asset_id) if bundle else None
+    if ts is None:
+        ts = fetch_arrays(adapter, asset_id, ["temperature"], tw)
+    cols = ts["columns"]
 
-    gap = gap_stats_from_rows(rows)
+    gap = gap_stats_from_flags(dq == "missing" for dq in cols["data_quality_flag"])
     missing = gap["missing_rows"]
 
     quality_notes = f"{missing} missing rows" if missing else "no missing rows"
@@ -72,8 +95,8 @@ def anomaly_scan_v0(
         quality_notes=quality_notes,
     )
 
-    temps = _filter_numeric(rows, "temperature")
-    temp_values = [v for _, v, dq in temps if dq != "missing"]
+    temp_ts, temp_vals, temp_dq = _filter_numeric(cols["timestamp"], cols["temperature"], cols["data_quality_flag"])
+    temp_values = [v for v, dq in zip(temp_vals, temp_dq) if dq != "missing"]
 
     if len(temp_values) < 40:
         ev.add_gap("Insufficient temperature points for anomaly scan.")
@@ -91,9 +114,8 @@ def anomaly_scan_v0(
 
     # Simple spike detection rule (v0):
     # define baseline as median-ish (50th percentile) and spike threshold as 95th percentile + margin
-    p50 = _percentile(temp_values, 0.50)
-    p95 = _percentile(temp_values, 0.95)
-    if p50 is None or p95 is None:
+    pcts = _percentiles(temp_values, (0.50, 0.95))
+    if pcts is None:
         ev.add_gap("Could not compute temperature percentiles.")
         conf = Confidence(band="low", reasons=["Temperature distribution unavailable."], escalation="ask_followup")
         return BrainResponse(
@@ -103,13 +125,27 @@ def anomaly_scan_v0(
             data={"asset_id": asset_id, "missing_rows": missing},
         )
 
+    p50, p95 = pcts
+
     # margin makes it robust for synthetic noise
     threshold = p95 + 1.0
 
-    spike_points = [(t, v) for (t, v, dq) in temps if dq != "missing" and v >= threshold]
+    # Bounded collection: count every spike and track the last timestamp, but only
+    # keep the first SPIKE_SAMPLE_CAP points (a pathological asset may spike on every row).
+    spike_count = 0
+    spike_sample: List[Tuple[datetime, float]] = []
+    last_spike_ts: Optional[datetime] = None
+    for t, v, dq in zip(temp_ts, temp_vals, temp_dq):
+        if v >= threshold and dq != "missing":
+            if spike_count < SPIKE_SAMPLE_CAP:
+                spike_sample.append((t, v))
+            spike_count += 1
+            last_spike_ts = t
+    first_spike_ts = spike_sample[0][0] if spike_sample else None
 
     # Pull events as secondary evidence
     events = adapter.get_events(asset_id, tw)
+    event_hit = any(e.get("event_type") == "temp_spike" for e in events)
 
     # Computation evidence
     ev.add_computation(
@@ -120,9 +156,9 @@ def anomaly_scan_v0(
             "p50": round(p50, 3),
             "p95": round(p95, 3),
             "threshold": round(threshold, 3),
-            "spike_count": len(spike_points),
-            "first_spike_ts": spike_points[0][0].isoformat() if spike_points else None,
-            "last_spike_ts": spike_points[-1][0].isoformat() if spike_points else None,
+            "spike_count": spike_count,
+            "first_spike_ts": first_spike_ts.isoformat() if first_spike_ts else None,
+            "last_spike_ts": last_spike_ts.isoformat() if last_spike_ts else None,
         },
         assumptions_refs=["ASSUMP_SYNTHETIC_DATA_BEHAVES_REALISTICALLY_V0"],
     )
@@ -137,9 +173,9 @@ def anomaly_scan_v0(
         reasons.append("Telemetry contains missing intervals; anomaly confidence reduced.")
 
     # If spikes detected, answer accordingly
-    if spike_points:
-        first = spike_points[0][0].isoformat()
-        last = spike_points[-1][0].isoformat()
+    if spike_count:
+        first = first_spike_ts.isoformat()
+        last = last_spike_ts.isoformat()
         answer = f"Temperature anomaly detected for {asset_id}: spike activity observed from {first} to {last} (threshold ≈ {threshold:.2f}°C)."
     else:
         answer = f"No temperature spike anomalies detected for {asset_id} in the window (threshold ≈ {threshold:.2f}°C)."
@@ -153,25 +189,17 @@ def anomaly_scan_v0(
         "asset_id": asset_id,
         "comparison_window": {"start": start_iso, "end": end_iso},
         "stats": {"p50": p50, "p95": p95, "threshold": threshold},
-        "spikes": [{"timestamp": t.isoformat(), "temperature": v} for (t, v) in spike_points[:20]],  # cap for readability
-        "spike_count": len(spike_points),
+        "spikes": [{"timestamp": t.isoformat(), "temperature": v} for (t, v) in spike_sample],
+        "spike_count": spike_count,
         "events": events,
         "missing_rows": missing,
     }
 
     # If events mention a spike, boost confidence slightly (still capped)
-    if any(e.get("event_type") == "temp_spike" for e in events) and spike_points:
+    if event_hit and spike_count:
         if band == "medium":
             reasons.append("Event log corroborates temperature spike detection.")
 
-    conf = Confidence(
-        band=band,
-        reasons=reasons if reasons else ["Sufficient temperature coverage for anomaly scan in v0."],
-        escalation=escalation,
-    )
-
-    event_hit = any(e.get("event_type") == "temp_spike" for e in events) if events else False
-
     # Existing v0 reasons/band/escalation computed above:
     # band, reasons, escalation
 
@@ -187,26 +215,19 @@ def anomaly_scan_v0(
         intent=intent,
     )
 
-    band = engine_conf["band"]
-    escalation = engine_conf["escalation"]
-
-    confidence = {
-        "band": band,
-        "reasons": reasons if reasons else ["Sufficient support for anomaly detection in v0."],
-        "escalation": escalation,
-    }
-
     data["confidence_v1"] = engine_conf
 
     return BrainResponse(
         answer=answer,
-        confidence=Confidence(band=band, reasons=confidence["reasons"], escalation=escalation),
+        confidence=Confidence(
+            band=engine_conf["band"],
+            reasons=reasons if reasons else ["Sufficient support for anomaly detection in v0."],
+            escalation=engine_conf["escalation"],
+        ),
         evidence=ev.finalize(),
         data=data,
     )
 
-    return BrainResponse(answer=answer, confidence=conf, evidence=ev.finalize(), data=data)
-
 
 def main() -> None:
     adapter = CsvTelemetryAdapter("synthetic_data/generated/v0")
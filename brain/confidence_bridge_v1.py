@@ -1,44 +1,44 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from itertools import groupby
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from confidence import ConfidenceEngineV1, ConfidenceSignals
+from confidence import ConfidenceEngineV1, ConfidenceResult, ConfidenceSignals
 
 _ENGINE = ConfidenceEngineV1()
 
 
+@lru_cache(maxsize=4096, typed=True)
+def _score_cached(signal_items: Tuple[Tuple[str, Any], ...], intent: Optional[str]) -> ConfidenceResult:
+    # Scoring is pure, and linked reasoning repeats the same inputs.
+    # typed=True keeps e.g. True and 1 as distinct keys.
+    return _ENGINE.score(ConfidenceSignals(**dict(signal_items)), context={"intent": intent} if intent else None)
+
+
+def gap_stats_from_flags(missing: Iterable[bool]) -> dict[str, int]:
+    """
+    Compute missing gap clustering statistics from a per-row missing mask
+    (True = row missing), e.g. a data_quality_flag column.
+    Run-length encodes the mask in one pass; only missing runs are counted.
+    Returns: {missing_rows, missing_streak_max, missing_streaks}
+    """
+    runs = [sum(1 for _ in run) for is_missing, run in groupby(missing) if is_missing]
+    return {
+        "missing_rows": sum(runs),
+        "missing_streak_max": max(runs, default=0),
+        "missing_streaks": len(runs),
+    }
+
+
 def gap_stats_from_rows(rows: list[dict]) -> dict[str, int]:
     """
     Compute missing gap clustering statistics from adapter rows.
     Assumes missing rows use data_quality_flag == "missing".
+    Row-oriented shim over gap_stats_from_flags.
     Returns: {missing_rows, missing_streak_max, missing_streaks}
     """
-    missing_rows = 0
-    missing_streak_max = 0
-    missing_streaks = 0
-
-    streak = 0
-    for r in rows:
-        is_missing = r.get("data_quality_flag") == "missing"
-        if is_missing:
-            missing_rows += 1
-            streak += 1
-        else:
-            if streak > 0:
-                missing_streaks += 1
-                missing_streak_max = max(missing_streak_max, streak)
-                streak = 0
-
-    # handle streak ending at end
-    if streak > 0:
-        missing_streaks += 1
-        missing_streak_max = max(missing_streak_max, streak)
-
-    return {
-        "missing_rows": missing_rows,
-        "missing_streak_max": missing_streak_max,
-        "missing_streaks": missing_streaks,
-    }
+    return gap_stats_from_flags(r.get("data_quality_flag") == "missing" for r in rows)
 
 
 def score_confidence_v1(
@@ -63,8 +63,11 @@ def score_confidence_v1(
 
     Returns the full engine result dict so intents can optionally use it later.
     For Issue #15, callers should NOT change outward-facing confidence fields.
+
+    Engine results are memoized per (signals, intent); each call still gets a
+    freshly serialized dict, so callers may mutate it safely.
     """
-    sig = ConfidenceSignals(
+    signals = dict(
         missing_rows=missing_rows,
         total_rows=total_rows,
         coverage_ratio=coverage_ratio,
@@ -78,5 +81,4 @@ def score_confidence_v1(
         severity=severity,
         novelty=novelty,
     )
-    res = _ENGINE.score(sig, context={"intent": intent} if intent else None)
-    return res.to_dict()
+    return _score_cached(tuple(signals.items()), intent).to_dict()
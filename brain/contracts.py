@@ -1,32 +1,41 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+import copy
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Confidence:
     band: str  # high | medium | low
     reasons: list[str]
     escalation: str  # none | ask_followup | human_review
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat record: build directly instead of asdict()'s recursive deepcopy
+        return {"band": self.band, "reasons": list(self.reasons), "escalation": self.escalation}
 
 
-@dataclass
+@dataclass(slots=True)
 class BrainResponse:
     answer: str
     confidence: Confidence
     evidence: Dict[str, Any]
     data: Optional[Dict[str, Any]] = None  # structured metrics payload (optional)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, deep: bool = False) -> Dict[str, Any]:
+        """
+        Serialize to the BrainResponse JSON shape.
+
+        By default `evidence` and `data` are aliased, not copied: mutating the
+        returned dict mutates this response. Pass deep=True for an isolated copy.
+        """
+        evidence = copy.deepcopy(self.evidence) if deep else self.evidence
         out = {
             "answer": self.answer,
             "confidence": self.confidence.to_dict(),
-            "evidence": self.evidence,
+            "evidence": evidence,
         }
         if self.data is not None:
-            out["data"] = self.data
+            out["data"] = copy.deepcopy(self.data) if deep else self.data
         return out
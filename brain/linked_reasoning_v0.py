@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
 from adapters.telemetry import CsvTelemetryAdapter
+from adapters.telemetry.csv_adapter import TimeWindow
 from brain.runner_v0 import compare_soh_trend_v0
 from brain.anomaly_scan_v0 import anomaly_scan_v0
 from brain.contracts import BrainResponse, Confidence
+from brain.telemetry_bundle_v0 import fetch_bundle
 
 from brain.confidence_bridge_v1 import score_confidence_v1
 
+# Shared pool for overlapping the follow-up anomaly scan with linked scoring
+_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="linked_v0")
+
 
 def linked_degradation_analysis_v0(
     adapter: CsvTelemetryAdapter,
@@ -25,6 +31,9 @@ def linked_degradation_analysis_v0(
     to produce an explanatory (not causal-proof) assessment.
     """
 
+    # Both intents read the same window: fetch telemetry once and share it
+    bundle = fetch_bundle(adapter, asset_ids, TimeWindow.from_iso(start_iso, end_iso))
+
     # Run independent intents
     degr = compare_soh_trend_v0(
         adapter,
@@ -33,17 +42,34 @@ def linked_degradation_analysis_v0(
         end_iso=end_iso,
         day7_boundary_iso=boundary_iso,
         role=role,
+        bundle=bundle,
     )
 
     winner = degr.data.get("winner")
-    anomaly = anomaly_scan_v0(
+
+    # The anomaly scan only needs `winner`: run it on the pool while the linked
+    # v1 confidence (which depends only on the comparison) is scored here.
+    anomaly_future = _POOL.submit(
+        anomaly_scan_v0,
         adapter,
         winner,
         start_iso=start_iso,
         end_iso=end_iso,
         role="ops",
+        bundle=bundle,
+    )
+
+    winner_stats = degr.data.get("per_asset", {}).get(winner, {})
+    engine_conf = score_confidence_v1(
+        missing_rows=winner_stats.get("missing_rows"),
+        total_rows=winner_stats.get("row_count"),
+        computed_metrics_ok=True,
+        corroboration=0.7,
+        intent="linked_degradation_v0",
     )
 
+    anomaly = anomaly_future.result()
+
     # Build linked answer
     answer = (
         f"{winner} is degrading faster than peer assets in the evaluated window. "
@@ -101,20 +127,9 @@ def linked_degradation_analysis_v0(
         },
     }
 
-    conf = Confidence(band=band, reasons=reasons, escalation=escalation)
-    
     # Existing v0 reasons/band/escalation computed above:
     # band, reasons, escalation
-    # Confidence Engine v1 (now active)
-    
-    engine_conf = score_confidence_v1(
-        missing_rows=(degr.data.get("per_asset", {}).get(winner, {}).get("missing_rows")),
-        total_rows=(degr.data.get("per_asset", {}).get(winner, {}).get("row_count")),
-        computed_metrics_ok=True,
-        corroboration=0.7,
-        intent="linked_degradation_v0",
-        )
-    
+    # Confidence Engine v1 (now active, scored above)
     band = engine_conf["band"]
     escalation = engine_conf["escalation"]
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 from typing import List, Optional
 
 from adapters.telemetry import CsvTelemetryAdapter
@@ -19,21 +20,28 @@ SUPPORTED_INTENTS = [
     "anomaly_scan_temp_v0",
     "linked_degradation_v0",
 ]
+_SUPPORTED_INTENT_SET = frozenset(SUPPORTED_INTENTS)  # membership; the list keeps display order
+
+# Keyword alternations compiled once: one scan of the question per check
+_WHY_RE = re.compile(r"why")
+_DEGRAD_RE = re.compile(r"degrad|soh")
+_ANOMALY_RE = re.compile(r"temp|thermal|overheat|spike|anomal")
+_SOH_RE = re.compile(r"soh|degrad|health|declin|trend|faster")
 
 
 def _infer_intent(question: str) -> str:
     q = (question or "").lower()
 
     # If user asks "why" + "degrad" -> linked reasoning
-    if "why" in q and ("degrad" in q or "soh" in q):
+    if _WHY_RE.search(q) and _DEGRAD_RE.search(q):
         return "linked_degradation_v0"
 
     # Temperature anomaly intent
-    if any(k in q for k in ["temp", "thermal", "overheat", "spike", "anomal"]):
+    if _ANOMALY_RE.search(q):
         return "anomaly_scan_temp_v0"
 
     # SoH / degradation compare intent
-    if any(k in q for k in ["soh", "degrad", "health", "declin", "trend", "faster"]):
+    if _SOH_RE.search(q):
         return "soh_trend_compare_v0"
 
     # Default: linked reasoning if multiple assets, else anomaly scan if single asset
@@ -55,7 +63,7 @@ def route(
     if chosen == "auto":
         chosen = _infer_intent(question)
 
-    if chosen not in SUPPORTED_INTENTS:
+    if chosen not in _SUPPORTED_INTENT_SET:
         return BrainResponse(
             answer=f"Unsupported intent: {chosen}. Supported: {SUPPORTED_INTENTS}",
             confidence=Confidence(band="low", reasons=["Invalid intent supplied."], escalation="ask_followup"),
@@ -1,69 +1,181 @@
 from __future__ import annotations
 
+import copy
 import json
+import threading
+import time
+import weakref
+from bisect import bisect_left
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from adapters.telemetry import CsvTelemetryAdapter
-from adapters.telemetry.csv_adapter import TimeWindow
-from evidence import EvidenceBuilder
+from adapters.telemetry.csv_adapter import TimeWindow, parse_iso, to_epoch_ns
+from evidence import EvidenceBuilder, new_evidence_stamp
 from brain.contracts import BrainResponse, Confidence
+from brain.telemetry_bundle_v0 import fetch_arrays
+
+from brain.confidence_bridge_v1 import score_confidence_v1
+
+_INTENT = "soh_trend_compare_v0"
+_SIGNALS = ("soh", "temperature")
+
+# Evidence literals, built once instead of per call
+_METHOD = (
+    "Split window into pre/post boundary; estimate slope per day using mean(last 10%) - mean(first 10%). "
+    "Compare post-boundary slopes across assets."
+)
+_ASSUMPTIONS_REFS = ("ASSUMP_SOH_IS_VALID_PROXY_V0",)
+_KB_RULE = {
+    "kb_ref": "knowledge_base/thresholds/README.md",
+    "rule_summary": "Threshold framework placeholder (v0).",
+    "impact_on_answer": "No threshold enforcement in v0; comparison is relative only.",
+}
+
+
+@dataclass(slots=True)
+class AssetStats:
+    pre_slope_per_day: Optional[float]
+    post_slope_per_day: Optional[float]
+    missing_rows: int
+    row_count: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "pre_slope_per_day": self.pre_slope_per_day,
+            "post_slope_per_day": self.post_slope_per_day,
+            "missing_rows": self.missing_rows,
+            "row_count": self.row_count,
+        }
 
-from brain.confidence_bridge_v1 import score_confidence_v1, gap_stats_from_rows
 
+COMPARE_CACHE_TTL_S = 60.0
+COMPARE_CACHE_SIZE = 128  # entries per adapter
+_clock = time.monotonic  # TTL clock; a module hook so tests can drive it
 
-def _parse_iso(ts: str) -> datetime:
-    dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt
+# adapter -> {(data_version, asset_ids, start, end, boundary, role): (expires_at, response)}
+# Weakly keyed so a cached result never keeps an adapter (and its data) alive.
+_COMPARE_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_COMPARE_CACHE_LOCK = threading.Lock()
 
 
-def _mean(values: List[float]) -> Optional[float]:
-    if not values:
-        return None
-    return sum(values) / len(values)
-
-
-def _filter_numeric(rows: List[Dict[str, Any]], key: str) -> List[Tuple[datetime, float]]:
-    out: List[Tuple[datetime, float]] = []
-    for r in rows:
-        v = r.get(key)
-        if v is None:
-            continue
-        try:
-            out.append((_parse_iso(r["timestamp"]), float(v)))
-        except Exception:
-            continue
-    out.sort(key=lambda x: x[0])
+def clear_compare_cache() -> None:
+    with _COMPARE_CACHE_LOCK:
+        _COMPARE_CACHE.clear()
+
+
+def _cache_get(adapter: CsvTelemetryAdapter, key: Tuple[Any, ...]) -> Optional[BrainResponse]:
+    now = _clock()
+    with _COMPARE_CACHE_LOCK:
+        entries = _COMPARE_CACHE.get(adapter)
+        hit = entries.get(key) if entries else None
+        if hit is None:
+            return None
+        expires_at, resp = hit
+        if expires_at <= now:
+            del entries[key]
+            return None
+
+    # Hand out a private copy with its own audit identity (new evidence_id/generated_at)
+    out = copy.deepcopy(resp)
+    out.evidence["evidence_id"], out.evidence["generated_at"] = new_evidence_stamp()
     return out
 
 
-def _slope_per_day(points: List[Tuple[datetime, float]]) -> Optional[float]:
+def _cache_put(adapter: CsvTelemetryAdapter, key: Tuple[Any, ...], resp: BrainResponse) -> None:
+    entry = (_clock() + COMPARE_CACHE_TTL_S, copy.deepcopy(resp))
+    with _COMPARE_CACHE_LOCK:
+        entries = _COMPARE_CACHE.setdefault(adapter, {})
+        entries.pop(key, None)
+        entries[key] = entry
+        while len(entries) > COMPARE_CACHE_SIZE:
+            del entries[next(iter(entries))]  # oldest insert first
+
+
+def _slope_per_day(timestamps_ns: List[int], values: List[float]) -> Optional[float]:
     """
-    Very simple slope estimate:
+    Very simple slope estimate over parallel (time-ordered) lists, with
+    timestamps as epoch nanoseconds:
     (mean(last 10%) - mean(first 10%)) / days_span
     Returns units: value per day.
     """
-    if len(points) < 20:
+    if len(values) < 20:
         return None
 
-    n = len(points)
+    n = len(values)
     k = max(3, int(0.1 * n))
-    first = [v for _, v in points[:k]]
-    last = [v for _, v in points[-k:]]
-    m1 = _mean(first)
-    m2 = _mean(last)
-    if m1 is None or m2 is None:
-        return None
+    # n >= 20 so both slices hold exactly k points; no empty-mean case
+    m1 = sum(values[:k]) / k
+    m2 = sum(values[-k:]) / k
 
-    t0 = points[0][0]
-    t1 = points[-1][0]
-    days = max(1e-6, (t1 - t0).total_seconds() / 86400.0)
+    # int / int is correctly rounded, so this equals timedelta.total_seconds()
+    seconds = (timestamps_ns[-1] - timestamps_ns[0]) / 1_000_000_000
+    days = max(1e-6, seconds / 86400.0)
     return (m2 - m1) / days
 
 
+def _asset_stats(
+    timestamps_ns: Sequence[int],
+    values: List[Optional[float]],
+    flags: List[str],
+    boundary_ns: int,
+) -> Tuple[Optional[float], Optional[float], int, int, int]:
+    """
+    Per-asset kernel over adapter columns (time-ordered, values coerced);
+    times are epoch-ns ints, so the split compares plain ints.
+    One pass counts missing-row runs and collects the non-null points (as
+    parallel lists, no per-point tuples); the points are then split at
+    `boundary` by binary search and each side's slope estimated with _slope_per_day.
+    Returns: (pre_slope, post_slope, missing_rows, missing_streak_max, missing_streaks)
+    """
+    ts_out: List[int] = []
+    v_out: List[float] = []
+    missing_rows = streak = streak_max = streaks = 0
+
+    for t, v, dq in zip(timestamps_ns, values, flags):
+        if dq == "missing":
+            missing_rows += 1
+            streak += 1
+            if streak == 1:
+                streaks += 1
+            if streak > streak_max:
+                streak_max = streak
+        else:
+            streak = 0
+        if v is not None:
+            ts_out.append(t)
+            v_out.append(v)
+
+    split = bisect_left(ts_out, boundary_ns)
+    return (
+        _slope_per_day(ts_out[:split], v_out[:split]),
+        _slope_per_day(ts_out[split:], v_out[split:]),
+        missing_rows,
+        streak_max,
+        streaks,
+    )
+
+
+def _process_asset(
+    adapter: CsvTelemetryAdapter,
+    asset_id: str,
+    tw: TimeWindow,
+    boundary_ns: int,
+    bundle: Optional[Dict[str, Dict[str, Any]]],
+) -> Tuple[Dict[str, Any], AssetStats, int, int]:
+    # Fetch + per-asset kernel for one asset
+    ts = bundle.get(asset_id) if bundle else None
+    if ts is None:
+        ts = fetch_arrays(adapter, asset_id, _SIGNALS, tw)
+
+    cols = ts["columns"]
+    pre_slope, post_slope, missing, streak_max, streaks = _asset_stats(
+        cols["timestamp_ns"], cols["soh"], cols["data_quality_flag"], boundary_ns
+    )
+    return ts, AssetStats(pre_slope, post_slope, missing, ts["row_count"]), streak_max, streaks
+
+
 def compare_soh_trend_v0(
     adapter: CsvTelemetryAdapter,
     asset_ids: List[str],
@@ -72,15 +184,61 @@ def compare_soh_trend_v0(
     end_iso: str,
     day7_boundary_iso: str,
     role: str = "asset_manager",
+    bundle: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> BrainResponse:
+    """
+    Compare post-boundary SoH slopes across assets.
+
+    `bundle` (see brain.telemetry_bundle_v0.fetch_bundle) lets a caller that already
+    fetched this window share it instead of querying the adapter again.
+
+    Results are cached per adapter for COMPARE_CACHE_TTL_S, keyed on
+    (adapter.data_version(), asset_ids, window, boundary, role); a hit is a
+    deep copy with a fresh evidence_id/generated_at. Entries are invalidated
+    by the TTL and by adapter reloads: a changed telemetry/events file gives
+    a new data version, so the next call misses and recomputes (entries for
+    the old version age out). clear_compare_cache() drops everything. Calls
+    that pass a `bundle`, and adapters without data_version(), bypass the cache.
+    """
+    # data_version() is optional in the adapter contract; without it a reload
+    # cannot be detected, so such adapters are not cached.
+    data_version = getattr(adapter, "data_version", None)
+    if bundle is not None or data_version is None:
+        return _compare_soh_trend(
+            adapter, asset_ids, start_iso, end_iso, day7_boundary_iso, role=role, bundle=bundle
+        )
+
+    # asset order is kept in the key: it drives evidence order and slope ties.
+    # The adapter's data version makes a reload miss instead of serving old results.
+    key = (data_version(), tuple(asset_ids), start_iso, end_iso, day7_boundary_iso, role)
+    cached = _cache_get(adapter, key)
+    if cached is not None:
+        return cached
+
+    resp = _compare_soh_trend(adapter, asset_ids, start_iso, end_iso, day7_boundary_iso, role=role)
+    _cache_put(adapter, key, resp)
+    return resp
+
+
+def _compare_soh_trend(
+    adapter: CsvTelemetryAdapter,
+    asset_ids: List[str],
+    start_iso: str,
+    end_iso: str,
+    day7_boundary_iso: str,
+    *,
+    role: str,
+    bundle: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> BrainResponse:
     question = f"Which asset is degrading faster between {asset_ids} in the given window?"
-    intent = "soh_trend_compare_v0"
+    intent = _INTENT
     ev = EvidenceBuilder.start(question, intent, role=role)
 
     tw = TimeWindow.from_iso(start_iso, end_iso)
-    boundary = _parse_iso(day7_boundary_iso)
+    # Converted once; the per-asset kernels compare epoch-ns ints against it
+    boundary_ns = to_epoch_ns(parse_iso(day7_boundary_iso))
 
-    per_asset: Dict[str, Any] = {}
+    per_asset: Dict[str, AssetStats] = {}
     gaps_notes: List[str] = []
 
     # --- NEW: gap clustering aggregates ---
@@ -89,52 +247,36 @@ def compare_soh_trend_v0(
     missing_streak_max = 0
     missing_streaks = 0
 
+    # Sequential on purpose: the per-asset work is in-memory, GIL-bound Python,
+    # so a thread pool only adds dispatch overhead.
     for asset_id in asset_ids:
-        ts = adapter.get_timeseries(asset_id, ["soh", "temperature"], tw, include_missing=True)
-
-        rows = ts["rows"]
-        gap = gap_stats_from_rows(rows)
-
-        missing = gap["missing_rows"]
+        ts, stats, streak_max, streaks = _process_asset(adapter, asset_id, tw, boundary_ns, bundle)
+        missing = stats.missing_rows
         quality_notes = f"{missing} missing rows" if missing else "no missing rows"
 
         # aggregate gap stats (worst-case logic)
-        total_missing_rows += gap["missing_rows"]
+        total_missing_rows += missing
         total_rows += ts["row_count"]
-        missing_streak_max = max(missing_streak_max, gap["missing_streak_max"])
-        missing_streaks += gap["missing_streaks"]
+        missing_streak_max = max(missing_streak_max, streak_max)
+        missing_streaks += streaks
 
         ev.add_data_used(
             source_type="telemetry",
             source_name=str(adapter.base_dir.name),
-            query={"asset_id": asset_id, "signals": ["soh", "temperature"], "granularity": "15m"},
+            query={"asset_id": asset_id, "signals": list(_SIGNALS), "granularity": "15m"},
             time_window=ts["time_window"],
             row_count=ts["row_count"],
             quality_notes=quality_notes,
         )
 
-        soh_points = _filter_numeric(rows, "soh")
-        pre = [(t, v) for (t, v) in soh_points if t < boundary]
-        post = [(t, v) for (t, v) in soh_points if t >= boundary]
-
-        pre_slope = _slope_per_day(pre)
-        post_slope = _slope_per_day(post)
-
-        per_asset[asset_id] = {
-            "pre_slope_per_day": pre_slope,
-            "post_slope_per_day": post_slope,
-            "missing_rows": missing,
-            "row_count": ts["row_count"],
-        }
+        per_asset[asset_id] = stats
 
         if missing > 0:
             gaps_notes.append(f"{asset_id} has {missing} missing telemetry rows in-window.")
 
-    def score(a: Dict[str, Any]) -> Optional[float]:
-        s = a.get("post_slope_per_day")
-        return s if s is not None else None
-
-    valid = [(aid, score(per_asset[aid])) for aid in asset_ids if score(per_asset[aid]) is not None]
+    valid = [
+        (aid, per_asset[aid].post_slope_per_day) for aid in asset_ids if per_asset[aid].post_slope_per_day is not None
+    ]
 
     if not valid:
         ev.add_gap("No valid post-boundary SoH slope could be computed for any asset.")
@@ -144,37 +286,45 @@ def compare_soh_trend_v0(
             reasons=["Missing or insufficient SoH data in the comparison window."],
             escalation="ask_followup",
         )
-        return BrainResponse(answer=answer, confidence=conf, evidence=ev.finalize(), data={"per_asset": per_asset})
+        per_asset_out = {aid: stats.to_dict() for aid, stats in per_asset.items()}
+        return BrainResponse(answer=answer, confidence=conf, evidence=ev.finalize(), data={"per_asset": per_asset_out})
 
-    # Pick most negative slope = fastest decline
-    worst_asset, _worst_slope = sorted(valid, key=lambda x: x[1])[0]
+    # Pick most negative slope = fastest decline (min keeps the first on ties, like a stable sort)
+    worst_asset, _worst_slope = min(valid, key=itemgetter(1))
 
-    outputs = {"boundary": day7_boundary_iso, "per_asset": per_asset, "winner": worst_asset}
+    # Serialize once; evidence outputs and data share the same per-asset dicts
+    per_asset_out = {aid: stats.to_dict() for aid, stats in per_asset.items()}
+    outputs = {"boundary": day7_boundary_iso, "per_asset": per_asset_out, "winner": worst_asset}
     ev.add_computation(
         name="soh_slope_compare",
         inputs=["soh"],
-        method="Split window into pre/post boundary; estimate slope per day using mean(last 10%) - mean(first 10%). Compare post-boundary slopes across assets.",
+        method=_METHOD,
         outputs=outputs,
-        assumptions_refs=["ASSUMP_SOH_IS_VALID_PROXY_V0"],
+        assumptions_refs=list(_ASSUMPTIONS_REFS),  # evidence lists stay caller-owned
     )
 
-    ev.add_kb_rule(
-        kb_ref="knowledge_base/thresholds/README.md",
-        rule_summary="Threshold framework placeholder (v0).",
-        impact_on_answer="No threshold enforcement in v0; comparison is relative only.",
-    )
+    ev.add_kb_rule(**_KB_RULE)
 
     # Confidence (v0 reasons only)
     reasons: List[str] = []
     band = "high"
     escalation = "none"
 
-    any_missing = any(per_asset[aid]["missing_rows"] > 0 for aid in asset_ids)
+    # One pass sets both flags; stop as soon as both are known
+    any_missing = any_none = False
+    for aid in asset_ids:
+        a = per_asset[aid]
+        if a.missing_rows > 0:
+            any_missing = True
+        if a.post_slope_per_day is None:
+            any_none = True
+        if any_missing and any_none:
+            break
+
     if any_missing:
         band = "medium"
         reasons.append("Telemetry contains missing intervals; trend confidence reduced.")
 
-    any_none = any(per_asset[aid]["post_slope_per_day"] is None for aid in asset_ids)
     if any_none:
         band = "medium"
         reasons.append("One or more assets lacked sufficient post-boundary points; comparison limited.")
@@ -195,7 +345,7 @@ def compare_soh_trend_v0(
     data = {
         "comparison_window": {"start": start_iso, "end": end_iso},
         "boundary": day7_boundary_iso,
-        "per_asset": per_asset,
+        "per_asset": per_asset_out,
         "winner": worst_asset,
     }
 
@@ -226,8 +376,6 @@ def compare_soh_trend_v0(
         data=data,
     )
 
-    return BrainResponse(answer=answer, confidence=conf, evidence=ev.finalize(), data=data)
-
 
 def main() -> None:
     adapter = CsvTelemetryAdapter("synthetic_data/generated/v0")
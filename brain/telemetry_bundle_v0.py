@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, List, Sequence
+
+from adapters.telemetry import CsvTelemetryAdapter
+from adapters.telemetry.csv_adapter import TimeWindow, parse_iso, to_epoch_ns
+
+BUNDLE_SIGNALS = ["soh", "temperature"]
+
+
+def fetch_arrays(
+    adapter: CsvTelemetryAdapter,
+    asset_id: str,
+    signals: Sequence[str],
+    time_window: TimeWindow,
+) -> Dict[str, Any]:
+    """
+    Columnar telemetry for one asset, missing rows included, in the
+    get_timeseries_arrays payload shape.
+
+    get_timeseries_arrays is optional in the adapter contract: adapters that
+    only implement get_timeseries get the same columns built from its rows.
+    """
+    get_arrays = getattr(adapter, "get_timeseries_arrays", None)
+    if get_arrays is not None:
+        return get_arrays(asset_id, list(signals), time_window, include_missing=True)
+
+    ts = adapter.get_timeseries(asset_id, list(signals), time_window)
+    rows = ts["rows"]
+    timestamps = [parse_iso(r["timestamp"]) for r in rows]
+    columns: Dict[str, Any] = {
+        "timestamp": timestamps,
+        "timestamp_ns": array("q", [to_epoch_ns(t) for t in timestamps]),
+        "data_quality_flag": [r.get("data_quality_flag") for r in rows],
+    }
+    for s in signals:
+        columns[s] = [r.get(s) for r in rows]
+
+    return {
+        "asset_id": asset_id,
+        "signals": list(signals),
+        "time_window": ts.get("time_window"),
+        "columns": columns,
+        "row_count": len(rows),
+    }
+
+
+def fetch_bundle(
+    adapter: CsvTelemetryAdapter,
+    asset_ids: List[str],
+    time_window: TimeWindow,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch soh + temperature telemetry once per asset so several intents over the
+    same window can share it (e.g. linked reasoning runs SoH compare + anomaly scan).
+
+    Returns {asset_id: fetch_arrays(...) payload}: columnar, with missing rows
+    included and timestamps as parsed datetimes.
+    """
+    return {asset_id: fetch_arrays(adapter, asset_id, BUNDLE_SIGNALS, time_window) for asset_id in asset_ids}
@@ -1,20 +1,169 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 from confidence.schema import ConfidenceSignals, ConfidenceResult, ConfidenceBreakdown
 
+# Reason strings, shared by every score() call.
+_R_SUFFICIENT = "Sufficient support for the conclusion at v1 confidence criteria."
+_R_COVERAGE_DEFAULT = "Coverage ratio not provided; using neutral default."
+_R_MISSING = "Telemetry contains missing intervals; confidence reduced."
+_R_CLUSTERED = "Missing telemetry is clustered (continuous gaps); confidence reduced."
+_R_MISSINGNESS_DEFAULT = "Missingness not provided; using neutral default."
+_R_STABILITY_DEFAULT = "Metric stability not provided; using neutral default."
+_R_METRICS_FAILED = "Some computations failed or were incomplete; confidence reduced."
+_R_CORROBORATED = "Independent evidence corroborates the finding."
+_R_CONTRADICTIONS = "Contradictory signals detected; confidence reduced."
+
 
 def _clamp(x: float, lo: float = 0.0, hi: float = 1.0) -> float:
-    return max(lo, min(hi, x))
+    # Branches instead of max(lo, min(hi, x)): no builtin calls on the hot path.
+    # Same results, including the edges: ties and -0.0 give the bound, NaN gives hi.
+    return lo if x <= lo else x if x < hi else hi
+
+
+SignalBatch = Union[Iterable[ConfidenceSignals], Mapping[str, Sequence[Any]]]
+
+
+def _iter_signals(signals: SignalBatch) -> Iterable[ConfidenceSignals]:
+    """
+    Accept either ConfidenceSignals records or a column mapping
+    ({field name: values}, one value per item; absent fields stay None).
+    """
+    if not isinstance(signals, Mapping):
+        return signals
+    names = list(signals)
+    if len({len(signals[n]) for n in names}) > 1:
+        raise ValueError("signal columns must all have the same length")
+    return [ConfidenceSignals(**dict(zip(names, row))) for row in zip(*(signals[n] for n in names))]
+
+
+# Reason bits set by _score_core; score() expands them via _REASON_TABLE,
+# whose order is the order reasons are reported in.
+_F_COVERAGE_DEFAULT = 1
+_F_MISSING = 2
+_F_CLUSTERED = 4
+_F_MISSINGNESS_DEFAULT = 8
+_F_STABILITY_DEFAULT = 16
+_F_METRICS_FAILED = 32
+_F_CORROBORATED = 64
+_F_CONTRADICTIONS = 128
+
+_REASON_TABLE = (
+    (_F_COVERAGE_DEFAULT, _R_COVERAGE_DEFAULT),
+    (_F_MISSING, _R_MISSING),
+    (_F_CLUSTERED, _R_CLUSTERED),
+    (_F_MISSINGNESS_DEFAULT, _R_MISSINGNESS_DEFAULT),
+    (_F_STABILITY_DEFAULT, _R_STABILITY_DEFAULT),
+    (_F_METRICS_FAILED, _R_METRICS_FAILED),
+    (_F_CORROBORATED, _R_CORROBORATED),
+    (_F_CONTRADICTIONS, _R_CONTRADICTIONS),
+)
+
+
+def _score_core(
+    coverage_ratio: Optional[float],
+    missing_rows: Optional[int],
+    total_rows: Optional[int],
+    missing_streak_max: Optional[int],
+    missing_streaks: Optional[int],
+    computed_metrics_ok: Optional[bool],
+    metric_stability: Optional[float],
+    corroboration: Optional[float],
+    contradictions: Optional[int],
+) -> Tuple[float, float, float, float, float, int]:
+    """
+    Arithmetic core of ConfidenceEngineV1: plain values in, per-component
+    scores (coverage, quality, corroboration, stability, contradiction; each
+    0..1) out, plus an int of _F_* reason bits. No strings or objects are
+    built here; score() materializes reasons from the bits.
+    """
+    flags = 0
+
+    # Missing-row ratio, shared by coverage and quality (None = missingness unknown)
+    if total_rows is not None and missing_rows is not None:
+        total = float(total_rows)
+        miss_ratio: Optional[float] = float(missing_rows) / total if total else 0.0
+    else:
+        miss_ratio = None
+
+    # ----- Coverage -----
+    if coverage_ratio is not None:
+        coverage = _clamp(coverage_ratio)
+    elif miss_ratio is not None:
+        coverage = _clamp(1.0 - miss_ratio)
+    else:
+        coverage = 0.6  # neutral default for gradual adoption
+        flags |= _F_COVERAGE_DEFAULT
+
+    # ----- Quality -----
+    # Quality is impacted by missingness; if not known, neutral.
+    if miss_ratio is not None:
+        quality = _clamp(1.0 - miss_ratio * 1.2)  # missing hurts a bit more than linear
+        if miss_ratio > 0.0:
+            flags |= _F_MISSING
+
+        # ----- Gap clustering penalty (Issue 17.1) -----
+        # Continuous missing blocks are riskier than scattered misses.
+        streak_max = missing_streak_max or 0
+        streaks = missing_streaks or 0
+
+        if streak_max > 0:
+            cluster_penalty = 0.0
 
+            # At 15m cadence: 4 = 1h gap; 8 = 2h; 16 = 4h.
+            if streak_max >= 4:
+                cluster_penalty += 0.05
+            if streak_max >= 8:
+                cluster_penalty += 0.07
+            if streak_max >= 16:
+                cluster_penalty += 0.10
 
-def _safe_div(a: float, b: float) -> float:
-    return a / b if b else 0.0
+            # If gaps are mostly scattered (many streaks, small max), reduce penalty.
+            if streaks >= 3 and streak_max <= 4:
+                cluster_penalty *= 0.5
 
+            if cluster_penalty > 0.0:
+                quality = _clamp(quality - cluster_penalty)
+                flags |= _F_CLUSTERED
+    else:
+        quality = 0.6
+        flags |= _F_MISSINGNESS_DEFAULT
 
-@dataclass
+    # ----- Stability -----
+    if metric_stability is not None:
+        stability = _clamp(metric_stability)
+    else:
+        # If we at least know metrics computed OK, treat as moderately stable
+        stability = 0.7 if computed_metrics_ok else 0.55
+        if computed_metrics_ok is None:
+            flags |= _F_STABILITY_DEFAULT
+        elif computed_metrics_ok is False:
+            flags |= _F_METRICS_FAILED
+
+    # ----- Corroboration -----
+    if corroboration is not None:
+        corroboration = _clamp(corroboration)
+        if corroboration >= 0.7:
+            flags |= _F_CORROBORATED
+    else:
+        corroboration = 0.5  # neutral: no corroboration signal provided
+        # No reason added; lack of corroboration isn't always a flaw.
+
+    # ----- Contradictions -----
+    contradictions = contradictions or 0
+    if contradictions <= 0:
+        contradiction = 1.0
+    else:
+        contradiction = _clamp(1.0 - 0.25 * float(contradictions))
+        flags |= _F_CONTRADICTIONS
+
+    return coverage, quality, corroboration, stability, contradiction, flags
+
+
+@dataclass(frozen=True)
 class ConfidenceEngineV1:
     """
     Confidence Engine v1
@@ -35,89 +184,53 @@ class ConfidenceEngineV1:
     high_threshold: float = 0.75
     medium_threshold: float = 0.50
 
-    def score(self, signals: ConfidenceSignals, *, context: Optional[Dict[str, Any]] = None) -> ConfidenceResult:
-        ctx = context or {}
-        reasons: List[str] = []
+    # Weight vector in component order, packed once at construction; the engine
+    # is frozen, so the w_* fields cannot drift from it after validation.
+    _weights: Tuple[float, ...] = field(init=False, repr=False, compare=False)
 
-        # ----- Coverage -----
-        if signals.coverage_ratio is not None:
-            coverage = _clamp(signals.coverage_ratio)
-        elif signals.total_rows is not None and signals.missing_rows is not None:
-            coverage = _clamp(1.0 - _safe_div(float(signals.missing_rows), float(signals.total_rows)))
-        else:
-            coverage = 0.6  # neutral default for gradual adoption
-            reasons.append("Coverage ratio not provided; using neutral default.")
-
-        # ----- Quality -----
-        # Quality is impacted by missingness; if not known, neutral.
-        if signals.total_rows is not None and signals.missing_rows is not None:
-            miss_ratio = _safe_div(float(signals.missing_rows), float(signals.total_rows))
-            quality = _clamp(1.0 - miss_ratio * 1.2)  # missing hurts a bit more than linear
-            if miss_ratio > 0.0:
-                reasons.append("Telemetry contains missing intervals; confidence reduced.")
-
-            # ----- Gap clustering penalty (Issue 17.1) -----
-            # Continuous missing blocks are riskier than scattered misses.
-            streak_max = signals.missing_streak_max or 0
-            streaks = signals.missing_streaks or 0
-
-            if streak_max > 0:
-                cluster_penalty = 0.0
-
-                # At 15m cadence: 4 = 1h gap; 8 = 2h; 16 = 4h.
-                if streak_max >= 4:
-                    cluster_penalty += 0.05
-                if streak_max >= 8:
-                    cluster_penalty += 0.07
-                if streak_max >= 16:
-                    cluster_penalty += 0.10
-
-                # If gaps are mostly scattered (many streaks, small max), reduce penalty.
-                if streaks >= 3 and streak_max <= 4:
-                    cluster_penalty *= 0.5
-
-                if cluster_penalty > 0.0:
-                    quality = _clamp(quality - cluster_penalty)
-                    reasons.append("Missing telemetry is clustered (continuous gaps); confidence reduced.")
-        else:
-            quality = 0.6
-            reasons.append("Missingness not provided; using neutral default.")
+    def __post_init__(self) -> None:
+        weights = (
+            self.w_coverage,
+            self.w_quality,
+            self.w_corroboration,
+            self.w_stability,
+            self.w_contradiction,
+        )
+        object.__setattr__(self, "_weights", weights)
+        # The combined score is only a 0..1 blend if the weights are a convex mix.
+        total = 0.0
+        for w in self._weights:
+            if w < 0.0:
+                raise ValueError(f"Confidence weights must be non-negative, got {self._weights}")
+            total += w
+        if not math.isclose(total, 1.0, abs_tol=1e-9):
+            raise ValueError(f"Confidence weights must sum to 1.0, got {total!r}")
 
-        # ----- Stability -----
-        if signals.metric_stability is not None:
-            stability = _clamp(signals.metric_stability)
-        else:
-            # If we at least know metrics computed OK, treat as moderately stable
-            stability = 0.7 if signals.computed_metrics_ok else 0.55
-            if signals.computed_metrics_ok is None:
-                reasons.append("Metric stability not provided; using neutral default.")
-            elif signals.computed_metrics_ok is False:
-                reasons.append("Some computations failed or were incomplete; confidence reduced.")
-
-        # ----- Corroboration -----
-        if signals.corroboration is not None:
-            corroboration = _clamp(signals.corroboration)
-            if corroboration >= 0.7:
-                reasons.append("Independent evidence corroborates the finding.")
-        else:
-            corroboration = 0.5  # neutral: no corroboration signal provided
-            # No reason added; lack of corroboration isn't always a flaw.
+    def score(self, signals: ConfidenceSignals, *, context: Optional[Dict[str, Any]] = None) -> ConfidenceResult:
+        ctx = context or {}
 
-        # ----- Contradictions -----
-        contradictions = signals.contradictions or 0
-        if contradictions <= 0:
-            contradiction = 1.0
-        else:
-            contradiction = _clamp(1.0 - 0.25 * float(contradictions))
-            reasons.append("Contradictory signals detected; confidence reduced.")
+        coverage, quality, corroboration, stability, contradiction, flags = _score_core(
+            signals.coverage_ratio,
+            signals.missing_rows,
+            signals.total_rows,
+            signals.missing_streak_max,
+            signals.missing_streaks,
+            signals.computed_metrics_ok,
+            signals.metric_stability,
+            signals.corroboration,
+            signals.contradictions,
+        )
 
         # ----- Combined score -----
+        # One unpack of the packed weights instead of five attribute lookups;
+        # written out left to right so rounding matches the original sum.
+        w_cov, w_qual, w_corr, w_stab, w_contra = self._weights
         score = (
-            self.w_coverage * coverage
-            + self.w_quality * quality
-            + self.w_corroboration * corroboration
-            + self.w_stability * stability
-            + self.w_contradiction * contradiction
+            w_cov * coverage
+            + w_qual * quality
+            + w_corr * corroboration
+            + w_stab * stability
+            + w_contra * contradiction
         )
         score = _clamp(score)
 
@@ -150,9 +263,8 @@ class ConfidenceEngineV1:
             # do not add too much noise to reasons
             pass
 
-        # Ensure reasons not empty (for UX)
-        if not reasons:
-            reasons = ["Sufficient support for the conclusion at v1 confidence criteria."]
+        # Materialize reasons from the bits, in table order; never empty (for UX)
+        reasons = [text for bit, text in _REASON_TABLE if flags & bit] if flags else [_R_SUFFICIENT]
 
         return ConfidenceResult(
             band=band,
@@ -162,3 +274,16 @@ class ConfidenceEngineV1:
             breakdown=breakdown,
             signals=signals.to_dict(),
         )
+
+    def score_batch(
+        self, signals: SignalBatch, *, context: Optional[Dict[str, Any]] = None
+    ) -> List[ConfidenceResult]:
+        """
+        Score many signal sets (e.g. one per asset) in one call, in input order.
+        Results match calling score() on each item with the same context.
+
+        `signals` may also be a column mapping such as
+        {"missing_rows": [...], "total_rows": [...]}; see _iter_signals.
+        """
+        score = self.score
+        return [score(s, context=context) for s in _iter_signals(signals)]
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConfidenceSignals:
     """
     Normalized signals used to score confidence across intents.
 
     All fields are optional so intents can adopt this gradually.
+    Instances are immutable.
     """
     # Data quality
     missing_rows: Optional[int] = None
@@ -34,10 +35,24 @@ class ConfidenceSignals:
     novelty: Optional[float] = None   # 0..1 how unusual/unseen (optional)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat record of scalars: build directly instead of asdict()'s recursive deepcopy
+        return {
+            "missing_rows": self.missing_rows,
+            "total_rows": self.total_rows,
+            "coverage_ratio": self.coverage_ratio,
+            "time_span_days": self.time_span_days,
+            "missing_streak_max": self.missing_streak_max,
+            "missing_streaks": self.missing_streaks,
+            "computed_metrics_ok": self.computed_metrics_ok,
+            "metric_stability": self.metric_stability,
+            "corroboration": self.corroboration,
+            "contradictions": self.contradictions,
+            "severity": self.severity,
+            "novelty": self.novelty,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfidenceBreakdown:
     coverage: float
     quality: float
@@ -46,10 +61,16 @@ class ConfidenceBreakdown:
     contradiction: float
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "coverage": self.coverage,
+            "quality": self.quality,
+            "corroboration": self.corroboration,
+            "stability": self.stability,
+            "contradiction": self.contradiction,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfidenceResult:
     band: str  # high | medium | low
     reasons: List[str]
@@ -59,6 +80,13 @@ class ConfidenceResult:
     signals: Dict[str, Any]
 
     def to_dict(self) -> Dict[str, Any]:
-        out = asdict(self)
-        out["breakdown"] = self.breakdown.to_dict()
-        return out
+        # Fresh containers on every call (results may be memoized and shared);
+        # `signals` holds only scalars, so a shallow copy is as safe as asdict().
+        return {
+            "band": self.band,
+            "reasons": list(self.reasons),
+            "escalation": self.escalation,
+            "score": self.score,
+            "breakdown": self.breakdown.to_dict(),
+            "signals": dict(self.signals),
+        }
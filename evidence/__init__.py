@@ -1,3 +1,3 @@
-from .builder import EvidenceBuilder
+from .builder import EvidenceBuilder, new_evidence_stamp
 
-__all__ = ["EvidenceBuilder"]
+__all__ = ["EvidenceBuilder", "new_evidence_stamp"]
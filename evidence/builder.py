@@ -2,20 +2,64 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-import uuid
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import secrets
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _new_evidence_id(now: datetime) -> str:
+    # Stable-ish readable id; 32 random bits keep it unique (same width as before)
+    return f"ev_{now.strftime('%Y%m%dT%H%M%SZ')}_{secrets.token_hex(4)}"
 
 
-def _new_evidence_id() -> str:
-    # Stable-ish readable id; uuid keeps it unique
-    return f"ev_{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}_{uuid.uuid4().hex[:8]}"
+def new_evidence_stamp() -> Tuple[str, str]:
+    """
+    Fresh (evidence_id, generated_at) from one clock read, e.g. to re-stamp
+    a copied evidence packet with its own audit identity.
+    """
+    now = datetime.now(timezone.utc)
+    return _new_evidence_id(now), now.isoformat()
+
+
+# Recorded entries are kept as named tuples (cheaper than a dict per add_* call)
+# and turned into the evidence/README.md dict shapes only in finalize().
+class DataUsed(NamedTuple):
+    source_type: str
+    source_name: str
+    query: Dict[str, Any]
+    time_window: Optional[Dict[str, str]]
+    row_count: Optional[int]
+    quality_notes: str
+
+
+class Computation(NamedTuple):
+    name: str
+    inputs: List[str]
+    method: str
+    outputs: Dict[str, Any]
+    assumptions_refs: List[str]
+
+
+class ModelCall(NamedTuple):
+    model_name: str
+    model_version: Optional[str]
+    inputs_summary: Dict[str, Any]
+    outputs_summary: Dict[str, Any]
+    model_confidence: Optional[Any]
+    limitations: str
 
 
-@dataclass
+class KbRule(NamedTuple):
+    kb_ref: str
+    rule_summary: str
+    impact_on_answer: str
+
+
+class Assumption(NamedTuple):
+    ref: str
+    description: str
+
+
+@dataclass(slots=True)
 class EvidenceBuilder:
     """
     Evidence Bundle Builder v0
@@ -32,20 +76,27 @@ class EvidenceBuilder:
     question: str
     intent: str
     role: Optional[str] = None
-    evidence_id: str = field(default_factory=_new_evidence_id)
-    generated_at: str = field(default_factory=_now_iso)
+    evidence_id: str = ""  # "" = stamp at construction (see __post_init__)
+    generated_at: str = ""
 
-    data_used: List[Dict[str, Any]] = field(default_factory=list)
-    computations: List[Dict[str, Any]] = field(default_factory=list)
-    model_calls: List[Dict[str, Any]] = field(default_factory=list)
-    kb_rules_applied: List[Dict[str, Any]] = field(default_factory=list)
+    data_used: List[DataUsed] = field(default_factory=list)
+    computations: List[Computation] = field(default_factory=list)
+    model_calls: List[ModelCall] = field(default_factory=list)
+    kb_rules_applied: List[KbRule] = field(default_factory=list)
 
-    assumptions: List[Dict[str, Any]] = field(default_factory=list)
+    assumptions: List[Assumption] = field(default_factory=list)
     gaps: List[str] = field(default_factory=list)
     risk_notes: List[str] = field(default_factory=list)
 
     attachments: Dict[str, List[str]] = field(default_factory=lambda: {"charts": [], "tables": [], "links": []})
 
+    def __post_init__(self) -> None:
+        # One clock read stamps both fields, so the id and generated_at agree.
+        if not (self.evidence_id and self.generated_at):
+            evidence_id, generated_at = new_evidence_stamp()
+            self.evidence_id = self.evidence_id or evidence_id
+            self.generated_at = self.generated_at or generated_at
+
     # -------------------------
     # Factory
     # -------------------------
@@ -66,16 +117,7 @@ class EvidenceBuilder:
         row_count: Optional[int] = None,
         quality_notes: str = "",
     ) -> None:
-        self.data_used.append(
-            {
-                "source_type": source_type,
-                "source_name": source_name,
-                "query": query,
-                "time_window": time_window,
-                "row_count": row_count,
-                "quality_notes": quality_notes,
-            }
-        )
+        self.data_used.append(DataUsed(source_type, source_name, query, time_window, row_count, quality_notes))
 
     def add_computation(
         self,
@@ -86,15 +128,7 @@ class EvidenceBuilder:
         outputs: Dict[str, Any],
         assumptions_refs: Optional[List[str]] = None,
     ) -> None:
-        self.computations.append(
-            {
-                "name": name,
-                "inputs": inputs,
-                "method": method,
-                "outputs": outputs,
-                "assumptions_refs": assumptions_refs or [],
-            }
-        )
+        self.computations.append(Computation(name, inputs, method, outputs, assumptions_refs or []))
 
     def add_model_call(
         self,
@@ -107,14 +141,14 @@ class EvidenceBuilder:
         limitations: str = "",
     ) -> None:
         self.model_calls.append(
-            {
-                "model_name": model_name,
-                "model_version": model_version,
-                "inputs_summary": inputs_summary or {},
-                "outputs_summary": outputs_summary or {},
-                "model_confidence": model_confidence,
-                "limitations": limitations,
-            }
+            ModelCall(
+                model_name,
+                model_version,
+                inputs_summary or {},
+                outputs_summary or {},
+                model_confidence,
+                limitations,
+            )
         )
 
     def add_kb_rule(
@@ -124,16 +158,10 @@ class EvidenceBuilder:
         rule_summary: str,
         impact_on_answer: str,
     ) -> None:
-        self.kb_rules_applied.append(
-            {
-                "kb_ref": kb_ref,
-                "rule_summary": rule_summary,
-                "impact_on_answer": impact_on_answer,
-            }
-        )
+        self.kb_rules_applied.append(KbRule(kb_ref, rule_summary, impact_on_answer))
 
     def add_assumption(self, *, ref: str, description: str) -> None:
-        self.assumptions.append({"ref": ref, "description": description})
+        self.assumptions.append(Assumption(ref, description))
 
     def add_gap(self, gap: str) -> None:
         self.gaps.append(gap)
@@ -156,12 +184,12 @@ class EvidenceBuilder:
             "question": self.question,
             "intent": self.intent,
             "role": self.role,
-            "data_used": self.data_used,
-            "computations": self.computations,
-            "model_calls": self.model_calls,
-            "kb_rules_applied": self.kb_rules_applied,
+            "data_used": [d._asdict() for d in self.data_used],
+            "computations": [c._asdict() for c in self.computations],
+            "model_calls": [m._asdict() for m in self.model_calls],
+            "kb_rules_applied": [k._asdict() for k in self.kb_rules_applied],
             "assumptions_and_gaps": {
-                "assumptions": self.assumptions,
+                "assumptions": [a._asdict() for a in self.assumptions],
                 "gaps": self.gaps,
                 "risk_notes": "; ".join(self.risk_notes) if self.risk_notes else "",
             },
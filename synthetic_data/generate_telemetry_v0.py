@@ -41,29 +41,46 @@ RACKS = [
     },
 ]
 
+# Per-rack attributes the row loop needs, as parallel tuples (RACKS order);
+# RACKS itself stays the assets.json record.
+RACK_IDS = tuple(r["asset_id"] for r in RACKS)
+RACK_TEMP_OFFSETS = tuple(0.0 if rack_id == "rack_01" else 2.0 for rack_id in RACK_IDS)
+
 # Intentional behaviors (from telemetry_v0.md)
 DAY7_INDEX = 7 * POINTS_PER_DAY  # after Day 7, rack_02 degradation accelerates
 
 # One short telemetry gap (≤2h): choose 8 points = 2h
 GAP_START = START_TS + timedelta(days=10, hours=10)  # arbitrary but consistent
 GAP_END = GAP_START + timedelta(minutes=CADENCE_MIN * 8)
+GAP_LO = 10 * POINTS_PER_DAY + (10 * 60) // CADENCE_MIN  # same window as row indices [lo, hi)
+GAP_HI = GAP_LO + 8
 
 # One minor anomaly: temp spike event (short duration)
 SPIKE_START = START_TS + timedelta(days=8, hours=14)
 SPIKE_END = SPIKE_START + timedelta(minutes=CADENCE_MIN * 4)  # 1 hour spike
+SPIKE_LO = 8 * POINTS_PER_DAY + (14 * 60) // CADENCE_MIN
+SPIKE_HI = SPIKE_LO + 4
+
+# Row loop uses the index ranges, events.csv the datetime bounds: keep them in step
+assert START_TS + timedelta(minutes=CADENCE_MIN * GAP_LO) == GAP_START
+assert START_TS + timedelta(minutes=CADENCE_MIN * GAP_HI) == GAP_END
+assert START_TS + timedelta(minutes=CADENCE_MIN * SPIKE_LO) == SPIKE_START
+assert START_TS + timedelta(minutes=CADENCE_MIN * SPIKE_HI) == SPIKE_END
 
 
 def clamp(x, lo, hi):
     return max(lo, min(hi, x))
 
 
-def soc_profile(t_index: int) -> float:
-    # Smooth daily cycle between ~25% and ~90%
-    # 0..(points/day-1) maps to 0..2π
-    phase = (t_index % POINTS_PER_DAY) / POINTS_PER_DAY * 2 * math.pi
-    base = 57.5 + 32.5 * math.sin(phase)  # 25..90
-    noise = random.uniform(-1.2, 1.2)
-    return clamp(base + noise, 0.0, 100.0)
+def uniform_from(u: float, a: float, b: float) -> float:
+    # random.uniform(a, b) for an already drawn random.random() value u
+    return a + (b - a) * u
+
+
+def soc_profile(t_index: int, u: float) -> float:
+    # Smooth daily cycle between ~25% and ~90% (base from SOC_BASE)
+    noise = uniform_from(u, -1.2, 1.2)
+    return clamp(SOC_BASE[t_index % POINTS_PER_DAY] + noise, 0.0, 100.0)
 
 
 def power_from_soc_change(prev_soc: float, curr_soc: float) -> float:
@@ -73,25 +90,14 @@ def power_from_soc_change(prev_soc: float, curr_soc: float) -> float:
     return clamp(delta * 4.0, -50.0, 50.0)
 
 
-def status_from_power(p: float) -> str:
-    if p > 2.0:
-        return "charging"
-    if p < -2.0:
-        return "discharging"
-    return "idle"
-
+def temp_baseline(rack_id: str, t_index: int, u: float) -> float:
+    # Daily wave + per-rack offset (from TEMP_BASE)
+    noise = uniform_from(u, -0.4, 0.4)
+    return TEMP_BASE[rack_id][t_index % POINTS_PER_DAY] + noise
 
-def temp_baseline(rack_id: str, t_index: int) -> float:
-    # rack_02 runs a bit hotter
-    offset = 0.0 if rack_id == "rack_01" else 2.0
-    # gentle daily wave
-    phase = (t_index % POINTS_PER_DAY) / POINTS_PER_DAY * 2 * math.pi
-    base = 28.0 + 1.8 * math.sin(phase)
-    noise = random.uniform(-0.4, 0.4)
-    return base + offset + noise
 
-
-def soh_value(rack_id: str, t_index: int) -> float:
+def soh_trend(rack_id: str, t_index: int) -> float:
+    # Noise-free SoH
     # Slow linear decline for rack_01
     # For rack_02: same decline until Day 7, then accelerates
     # Units: percent; start around ~100%
@@ -105,12 +111,25 @@ def soh_value(rack_id: str, t_index: int) -> float:
         if t_index >= DAY7_INDEX:
             extra = (0.006 / POINTS_PER_DAY) * (t_index - DAY7_INDEX)  # extra ~0.006% per day after day 7
         decline = per_point_decline_base * t_index + extra
-    noise = random.uniform(-0.01, 0.01)
-    return clamp(start - decline + noise, 80.0, 100.0)
+    return start - decline
+
+
+def soh_value(rack_id: str, t_index: int, u: float) -> float:
+    noise = uniform_from(u, -0.01, 0.01)
+    return clamp(SOH_BASE[rack_id][t_index] + noise, 80.0, 100.0)
 
 
-def is_in_window(ts: datetime, start: datetime, end: datetime) -> bool:
-    return start <= ts < end
+# Noise-free profile components, computed once for the whole series so the
+# row loop only draws noise. Same expressions as per row, so same floats.
+# 0..(points/day-1) maps to 0..2π
+DAILY_SIN = [math.sin(k / POINTS_PER_DAY * 2 * math.pi) for k in range(POINTS_PER_DAY)]
+SOC_BASE = [57.5 + 32.5 * s for s in DAILY_SIN]  # 25..90
+TEMP_BASE = {
+    # rack_02 runs a bit hotter; gentle daily wave
+    rack_id: [28.0 + 1.8 * s + offset for s in DAILY_SIN]
+    for rack_id, offset in zip(RACK_IDS, RACK_TEMP_OFFSETS)
+}
+SOH_BASE = {rack_id: [soh_trend(rack_id, i) for i in range(TOTAL_POINTS)] for rack_id in RACK_IDS}
 
 
 def main():
@@ -166,75 +185,65 @@ def main():
         )
 
     # Write telemetry.csv
-    with TELEMETRY_PATH.open("w", newline="", encoding="utf-8") as f:
-        fieldnames = [
-            "timestamp",
-            "asset_id",
-            "soc",
-            "soh",
-            "temperature",
-            "power",
-            "status",
-            "data_quality_flag",
-        ]
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-
-        prev_soc = {r["asset_id"]: None for r in RACKS}
-
-        for i in range(TOTAL_POINTS):
-            ts = START_TS + timedelta(minutes=CADENCE_MIN * i)
-
-            for rack in RACKS:
-                rack_id = rack["asset_id"]
-
-                # Telemetry gap: we mark points as missing and skip writing core signals
-                if rack_id == "rack_02" and is_in_window(ts, GAP_START, GAP_END):
-                    w.writerow(
-                        {
-                            "timestamp": ts.isoformat(),
-                            "asset_id": rack_id,
-                            "soc": "",
-                            "soh": "",
-                            "temperature": "",
-                            "power": "",
-                            "status": "",
-                            "data_quality_flag": "missing",
-                        }
-                    )
-                    continue
-
-                soc = soc_profile(i)
-                soh = soh_value(rack_id, i)
-                temp = temp_baseline(rack_id, i)
-
-                # Inject spike in rack_02 temperature
-                if rack_id == "rack_02" and is_in_window(ts, SPIKE_START, SPIKE_END):
-                    temp += 8.0  # short spike
-
-                # power/status derived from SOC movement (simple synthetic behavior)
-                pwr = 0.0
-                if prev_soc[rack_id] is not None:
-                    pwr = power_from_soc_change(prev_soc[rack_id], soc)
-                prev_soc[rack_id] = soc
-
-                status = status_from_power(pwr)
-
-                # data quality: mostly ok
-                dq = "ok"
-
-                w.writerow(
-                    {
-                        "timestamp": ts.isoformat(),
-                        "asset_id": rack_id,
-                        "soc": f"{soc:.2f}",
-                        "soh": f"{soh:.4f}",
-                        "temperature": f"{temp:.2f}",
-                        "power": f"{pwr:.2f}",
-                        "status": status,
-                        "data_quality_flag": dq,
-                    }
-                )
+    fieldnames = [
+        "timestamp",
+        "asset_id",
+        "soc",
+        "soh",
+        "temperature",
+        "power",
+        "status",
+        "data_quality_flag",
+    ]
+    # Rows are pre-formatted lines (csv's default "\r\n" terminator): no field
+    # needs quoting, so DictWriter's per-row dict->list and escaping is skipped.
+    # Lines are collected and written as one encoded buffer, not per row.
+    lines = [",".join(fieldnames) + "\r\n"]
+    append = lines.append
+
+    prev_soc = {rack_id: None for rack_id in RACK_IDS}
+
+    # All noise in one bulk draw: three values per written row, consumed in the
+    # order the per-row random.uniform calls used to make them (per step, per
+    # rack: soc, soh, temp; gap rows draw none), so seeded output is unchanged.
+    n_rows = TOTAL_POINTS * len(RACK_IDS) - (GAP_HI - GAP_LO)
+    draw = iter([random.random() for _ in range(3 * n_rows)]).__next__
+
+    for i in range(TOTAL_POINTS):
+        ts = START_TS + timedelta(minutes=CADENCE_MIN * i)
+        ts_iso = ts.isoformat()  # formatted once, shared by every rack at this step
+
+        for rack_id in RACK_IDS:
+            # Telemetry gap: we mark points as missing and skip writing core signals
+            if rack_id == "rack_02" and GAP_LO <= i < GAP_HI:
+                append(f"{ts_iso},{rack_id},,,,,,missing\r\n")
+                continue
+
+            soc = soc_profile(i, draw())
+            soh = soh_value(rack_id, i, draw())
+            temp = temp_baseline(rack_id, i, draw())
+
+            # Inject spike in rack_02 temperature
+            if rack_id == "rack_02" and SPIKE_LO <= i < SPIKE_HI:
+                temp += 8.0  # short spike
+
+            # power/status derived from SOC movement (simple synthetic behavior)
+            pwr = 0.0
+            prev = prev_soc[rack_id]
+            if prev is not None:
+                pwr = power_from_soc_change(prev, soc)
+            prev_soc[rack_id] = soc
+
+            # status from power, inline (one branch per row instead of a call):
+            # > 2 kW charging, < -2 kW discharging, otherwise idle
+            status = "charging" if pwr > 2.0 else "discharging" if pwr < -2.0 else "idle"
+
+            # data quality: mostly ok
+            dq = "ok"
+
+            append(f"{ts_iso},{rack_id},{soc:.2f},{soh:.4f},{temp:.2f},{pwr:.2f},{status},{dq}\r\n")
+
+    TELEMETRY_PATH.write_bytes("".join(lines).encode("utf-8"))
 
     print("Generated:")
     print(f"- {ASSETS_PATH}")
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from brain.confidence_bridge_v1 import gap_stats_from_flags, gap_stats_from_rows, score_confidence_v1
+
+
+def test_gap_stats_count_runs_including_trailing_streak():
+    flags = [False, True, True, False, True, False, False, True, True, True]
+
+    assert gap_stats_from_flags(flags) == {
+        "missing_rows": 6,
+        "missing_streak_max": 3,
+        "missing_streaks": 3,
+    }
+
+
+def test_gap_stats_without_missing_rows():
+    assert gap_stats_from_flags([]) == {"missing_rows": 0, "missing_streak_max": 0, "missing_streaks": 0}
+    assert gap_stats_from_flags([False] * 5)["missing_streaks"] == 0
+
+
+def test_row_shim_matches_flag_mask():
+    rows = [{"data_quality_flag": f} for f in ["ok", "missing", "missing", "ok", "missing"]]
+
+    assert gap_stats_from_rows(rows) == gap_stats_from_flags([False, True, True, False, True])
+
+
+def test_score_confidence_v1_memoizes_but_returns_fresh_dicts():
+    kwargs = dict(missing_rows=8, total_rows=1344, computed_metrics_ok=True, intent="soh_trend_compare_v0")
+
+    first = score_confidence_v1(**kwargs)
+    first["reasons"].append("caller mutation")
+    first["signals"]["missing_rows"] = 0
+    first["breakdown"]["quality"] = 0.0
+    second = score_confidence_v1(**kwargs)
+
+    assert "caller mutation" not in second["reasons"]
+    assert second["breakdown"]["quality"] > 0.0
+    assert second["score"] == first["score"]
+    assert second["signals"]["missing_rows"] == 8
+
+
+def test_score_confidence_v1_accepts_gap_clustering_signals():
+    # Intents pass time span and gap-structure signals through the bridge
+    out = score_confidence_v1(
+        missing_rows=8,
+        total_rows=1344,
+        time_span_days=14.0,
+        missing_streak_max=8,
+        missing_streaks=1,
+        computed_metrics_ok=True,
+        intent="anomaly_scan_temp_v0",
+    )
+
+    assert out["signals"]["time_span_days"] == 14.0
+    assert out["signals"]["missing_streak_max"] == 8
+    assert out["signals"]["missing_streaks"] == 1
+    assert "Missing telemetry is clustered (continuous gaps); confidence reduced." in out["reasons"]
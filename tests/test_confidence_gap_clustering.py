@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import dataclasses
+
+import pytest
+
 from confidence import ConfidenceEngineV1, ConfidenceSignals
 
 
@@ -25,3 +29,86 @@ def test_clustered_missing_penalizes_more_than_scattered():
 
     # clustered should be lower score than scattered
     assert s2 < s1
+
+
+def test_gap_clustering_penalty_steps_with_longest_streak():
+    eng = ConfidenceEngineV1()
+    base = dict(missing_rows=16, total_rows=1344, computed_metrics_ok=True)
+
+    def quality(streak_max: int, streaks: int) -> float:
+        sig = ConfidenceSignals(**base, missing_streak_max=streak_max, missing_streaks=streaks)
+        return eng.score(sig).breakdown.quality
+
+    unclustered = quality(1, 16)
+    # 1h, 2h and 4h runs each add to the penalty
+    assert unclustered > quality(4, 1) > quality(8, 1) > quality(16, 1)
+    assert abs((unclustered - quality(16, 1)) - 0.22) < 1e-9
+    # Many short runs (max <= 1h) get half the 1h penalty
+    assert abs((unclustered - quality(4, 4)) - 0.025) < 1e-9
+
+    # Without streak signals no clustering penalty or reason applies
+    plain = eng.score(ConfidenceSignals(**base))
+    assert plain.breakdown.quality == unclustered
+    assert not any("clustered" in r for r in plain.reasons)
+
+
+def test_score_batch_matches_per_item_scoring():
+    eng = ConfidenceEngineV1()
+    batch = [
+        ConfidenceSignals(missing_rows=8, total_rows=1344, missing_streak_max=8, missing_streaks=1, computed_metrics_ok=True),
+        ConfidenceSignals(missing_rows=0, total_rows=1344, corroboration=0.8, computed_metrics_ok=True),
+        ConfidenceSignals(),
+    ]
+
+    assert eng.score_batch(batch) == [eng.score(s) for s in batch]
+    assert eng.score_batch([]) == []
+
+
+def test_score_batch_accepts_signal_columns():
+    eng = ConfidenceEngineV1()
+    columns = {
+        "missing_rows": [8, 0, None],
+        "total_rows": [1344, 1344, None],
+        "corroboration": [None, 0.8, None],
+    }
+    records = [
+        ConfidenceSignals(missing_rows=8, total_rows=1344),
+        ConfidenceSignals(missing_rows=0, total_rows=1344, corroboration=0.8),
+        ConfidenceSignals(),
+    ]
+
+    assert eng.score_batch(columns) == eng.score_batch(records)
+    assert eng.score_batch({}) == []
+
+    with pytest.raises(ValueError):
+        eng.score_batch({"missing_rows": [1, 2], "total_rows": [10]})
+
+
+def test_signals_are_frozen_and_serialize_to_fresh_dicts():
+    sig = ConfidenceSignals(missing_rows=8, total_rows=1344)
+
+    first = sig.to_dict()
+    first["missing_rows"] = 0
+
+    assert sig.to_dict()["missing_rows"] == 8
+    assert sig.to_dict() == dataclasses.asdict(sig)  # no hidden cache fields
+    assert sig == ConfidenceSignals(missing_rows=8, total_rows=1344)
+    with pytest.raises(AttributeError):
+        sig.missing_rows = 1
+
+
+def test_engine_rejects_weights_that_are_not_a_convex_mix():
+    assert ConfidenceEngineV1(w_coverage=0.3, w_quality=0.2)._weights[:2] == (0.3, 0.2)
+
+    with pytest.raises(ValueError, match="sum to 1.0"):
+        ConfidenceEngineV1(w_coverage=0.5)
+    with pytest.raises(ValueError, match="non-negative"):
+        ConfidenceEngineV1(w_coverage=0.5, w_contradiction=-0.15)
+
+
+def test_engine_weights_cannot_be_mutated_after_construction():
+    eng = ConfidenceEngineV1()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        eng.w_coverage = 0.9
+    assert eng._weights[0] == 0.25
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from brain.contracts import BrainResponse, Confidence
+
+
+def _response() -> BrainResponse:
+    return BrainResponse(
+        answer="ok",
+        confidence=Confidence(band="high", reasons=["fine"], escalation="none"),
+        evidence={"gaps": []},
+        data={"per_asset": {"rack_01": {"missing_rows": 0}}},
+    )
+
+
+def test_to_dict_aliases_evidence_and_data_by_default():
+    resp = _response()
+    out = resp.to_dict()
+
+    assert out["evidence"] is resp.evidence
+    assert out["data"] is resp.data
+    assert out["confidence"] == {"band": "high", "reasons": ["fine"], "escalation": "none"}
+
+
+def test_to_dict_deep_copy_is_isolated():
+    resp = _response()
+    out = resp.to_dict(deep=True)
+
+    out["data"]["per_asset"]["rack_01"]["missing_rows"] = 5
+    out["evidence"]["gaps"].append("x")
+
+    assert resp.data["per_asset"]["rack_01"]["missing_rows"] == 0
+    assert resp.evidence["gaps"] == []
+
+
+def test_to_dict_omits_data_when_absent():
+    resp = BrainResponse(
+        answer="n/a",
+        confidence=Confidence(band="low", reasons=[], escalation="ask_followup"),
+        evidence={},
+    )
+    assert "data" not in resp.to_dict()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from adapters.telemetry import CsvTelemetryAdapter
+from adapters.telemetry.csv_adapter import TimeWindow
+
+TELEMETRY_HEADER = "timestamp,asset_id,soc,soh,temperature,power,status,data_quality_flag\n"
+
+
+def _write_dataset(base: Path, telemetry_lines: list[str], event_lines: list[str]) -> Path:
+    base.mkdir(parents=True, exist_ok=True)
+    (base / "assets.json").write_text(
+        json.dumps({"site": {"asset_id": "site", "asset_type": "site"}, "assets": [{"asset_id": "rack_01"}]}),
+        encoding="utf-8",
+    )
+    (base / "telemetry.csv").write_text(TELEMETRY_HEADER + "".join(telemetry_lines), encoding="utf-8")
+    (base / "events.csv").write_text(
+        "event_id,asset_id,event_type,start_ts,end_ts,severity,notes\n" + "".join(event_lines),
+        encoding="utf-8",
+    )
+    return base
+
+
+def test_timeseries_window_is_half_open_and_time_ordered(tmp_path):
+    # Rows deliberately out of order and interleaved across assets
+    base = _write_dataset(
+        tmp_path / "v0",
+        [
+            "2025-12-01T00:30:00+00:00,rack_01,50.0,99.0,30.0,0.0,idle,ok\n",
+            "2025-12-01T00:00:00Z,rack_01,48.0,99.5,29.0,1.0,idle,ok\n",
+            "2025-12-01T00:15:00+00:00,rack_02,47.0,98.0,31.0,0.0,idle,ok\n",
+            "2025-12-01T00:15:00+00:00,rack_01,,,,,,missing\n",
+            "2025-12-01T00:45:00+00:00,rack_01,52.0,98.9,30.5,3.0,charging,ok\n",
+        ],
+        [],
+    )
+    adapter = CsvTelemetryAdapter(base)
+
+    tw = TimeWindow.from_iso("2025-12-01T00:00:00+00:00", "2025-12-01T00:45:00+00:00")
+    ts = adapter.get_timeseries("rack_01", ["soh", "status"], tw)
+
+    assert [r["timestamp"] for r in ts["rows"]] == [
+        "2025-12-01T00:00:00+00:00",
+        "2025-12-01T00:15:00+00:00",
+        "2025-12-01T00:30:00+00:00",
+    ]
+    assert ts["rows"][0]["soh"] == 99.5
+    assert ts["rows"][1] == {
+        "timestamp": "2025-12-01T00:15:00+00:00",
+        "data_quality_flag": "missing",
+        "soh": None,
+        "status": None,
+    }
+
+    no_missing = adapter.get_timeseries("rack_01", ["soh"], tw, include_missing=False)
+    assert no_missing["row_count"] == 2
+
+    assert adapter.get_timeseries("rack_99", ["soh"], tw)["rows"] == []
+
+
+def test_events_overlap_window_and_sorted_by_start(tmp_path):
+    base = _write_dataset(
+        tmp_path / "v0",
+        ["2025-12-01T00:00:00+00:00,rack_01,50.0,99.0,30.0,0.0,idle,ok\n"],
+        [
+            "ev_late,rack_01,temp_spike,2025-12-03T00:00:00+00:00,2025-12-03T01:00:00+00:00,minor,late\n",
+            "ev_early,rack_01,telemetry_gap,2025-11-30T23:00:00+00:00,2025-12-01T01:00:00+00:00,minor,early\n",
+            "ev_before,rack_01,telemetry_gap,2025-11-30T00:00:00+00:00,2025-12-01T00:00:00+00:00,minor,before\n",
+        ],
+    )
+    adapter = CsvTelemetryAdapter(base)
+
+    all_events = adapter.get_events("rack_01")
+    assert [e["event_id"] for e in all_events] == ["ev_before", "ev_early", "ev_late"]
+
+    tw = TimeWindow.from_iso("2025-12-01T00:00:00+00:00", "2025-12-03T00:00:00+00:00")
+    assert [e["event_id"] for e in adapter.get_events("rack_01", tw)] == ["ev_early"]
+
+
+def test_repeated_queries_are_served_from_cache(tmp_path):
+    base = _write_dataset(
+        tmp_path / "v0",
+        [
+            "2025-12-01T00:00:00+00:00,rack_01,48.0,99.5,29.0,1.0,idle,ok\n",
+            "2025-12-01T00:15:00+00:00,rack_01,50.0,99.0,30.0,0.0,idle,ok\n",
+        ],
+        ["ev_1,rack_01,temp_spike,2025-12-01T00:00:00+00:00,2025-12-01T01:00:00+00:00,minor,spike\n"],
+    )
+    adapter = CsvTelemetryAdapter(base)
+    tw = TimeWindow.from_iso("2025-12-01T00:00:00+00:00", "2025-12-02T00:00:00+00:00")
+
+    first = adapter.get_timeseries("rack_01", ["soh"], tw)
+    first["rows"][0]["soh"] = -999.0  # callers own their row dicts
+    second = adapter.get_timeseries("rack_01", ["soh"], tw)
+
+    assert second["rows"][0]["soh"] == 99.5
+    assert first["rows"] is not second["rows"]
+    assert adapter._cached_rows.cache_info().hits == 1
+
+    events = adapter.get_events("rack_01", tw)
+    events[0]["severity"] = "CORRUPTED"
+    assert adapter.get_events("rack_01", tw)[0]["severity"] == "minor"
+    assert adapter._cached_events.cache_info().hits == 1
+
+    # Different signal selection is a different cache entry
+    other = adapter.get_timeseries("rack_01", ["temperature"], tw)
+    assert other["rows"][0]["temperature"] == 29.0
+
+
+def test_raw_datetime_returns_parsed_timestamps(tmp_path):
+    base = _write_dataset(
+        tmp_path / "v0",
+        ["2025-12-01T00:00:00Z,rack_01,48.0,99.5,29.0,1.0,idle,ok\n"],
+        [],
+    )
+    adapter = CsvTelemetryAdapter(base)
+
+    iso_rows = adapter.get_timeseries("rack_01", ["soh"])["rows"]
+    dt_rows = adapter.get_timeseries("rack_01", ["soh"], raw_datetime=True)["rows"]
+
+    assert isinstance(dt_rows[0]["timestamp"], datetime)
+    assert dt_rows[0]["timestamp"].isoformat() == iso_rows[0]["timestamp"] == "2025-12-01T00:00:00+00:00"
+
+
+def test_time_window_epoch_ns_bounds():
+    tw = TimeWindow.from_iso("1970-01-01T00:00:01.000002Z", "1970-01-01T01:00:00+01:00")
+
+    assert tw.start_ns == 1_000_002_000
+    assert tw.end_ns == 0
+
+
+def test_timeseries_arrays_match_row_view(tmp_path):
+    base = _write_dataset(
+        tmp_path / "v0",
+        [
+            "2025-12-01T00:15:00+00:00,rack_01,,,,,,missing\n",
+            "2025-12-01T00:00:00+00:00,rack_01,48.0,99.5,29.0,1.0,idle,ok\n",
+            "2025-12-01T00:30:00+00:00,rack_01,50.0,99.0,30.0,0.0,idle,ok\n",
+        ],
+        [],
+    )
+    adapter = CsvTelemetryAdapter(base)
+    tw = TimeWindow.from_iso("2025-12-01T00:00:00+00:00", "2025-12-02T00:00:00+00:00")
+
+    arrays = adapter.get_timeseries_arrays("rack_01", ["soh"], tw)
+    rows = adapter.get_timeseries("rack_01", ["soh"], tw, raw_datetime=True)["rows"]
+    cols = arrays["columns"]
+
+    assert arrays["row_count"] == len(rows) == 3
+    assert cols["timestamp"] == [r["timestamp"] for r in rows]
+    assert cols["soh"] == [99.5, None, 99.0]
+    assert cols["data_quality_flag"] == ["ok", "missing", "ok"]
+    assert list(cols["timestamp_ns"]) == [tw.start_ns + i * 900_000_000_000 for i in range(3)]
+
+    # Columns are copies: mutating them does not leak into later queries
+    cols["soh"].clear()
+    assert adapter.get_timeseries_arrays("rack_01", ["soh"], tw)["columns"]["soh"] == [99.5, None, 99.0]
+
+    present = adapter.get_timeseries_arrays("rack_01", ["soh"], tw, include_missing=False)
+    assert present["columns"]["soh"] == [99.5, 99.0]
+    assert list(present["columns"]["timestamp_ns"]) == [tw.start_ns, tw.start_ns + 1_800_000_000_000]
+
+    assert adapter.get_timeseries_arrays("rack_99", ["soh"], tw)["row_count"] == 0
+
+
+def test_parsed_files_are_shared_and_reloaded_when_changed(tmp_path):
+    base = _write_dataset(
+        tmp_path / "v0",
+        ["2025-12-01T00:00:00+00:00,rack_01,48.0,99.5,29.0,1.0,idle,ok\n"],
+        [],
+    )
+    first = CsvTelemetryAdapter(base)
+    second = CsvTelemetryAdapter(base)
+    assert first._telemetry_by_asset is second._telemetry_by_asset  # one parse per file version
+
+    assert first.get_timeseries("rack_01", ["soh"])["row_count"] == 1
+
+    telemetry = base / "telemetry.csv"
+    with telemetry.open("a", encoding="utf-8") as f:
+        f.write("2025-12-01T00:15:00+00:00,rack_01,50.0,99.0,30.0,0.0,idle,ok\n")
+    st = telemetry.stat()
+    os.utime(telemetry, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert first.get_timeseries("rack_01", ["soh"])["row_count"] == 2
+    assert second.get_timeseries_arrays("rack_01", ["soh"])["columns"]["soh"] == [99.5, 99.0]
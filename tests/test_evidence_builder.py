@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from evidence import EvidenceBuilder, new_evidence_stamp
+
+
+def test_finalize_materializes_recorded_entries_as_dicts():
+    ev = EvidenceBuilder.start("q", "soh_trend_compare_v0", role="ops")
+    ev.add_data_used(source_type="telemetry", source_name="v0", query={"asset_id": "rack_01"}, row_count=3)
+    ev.add_computation(name="slope", inputs=["soh"], method="ols", outputs={"slope": -0.1})
+    ev.add_model_call(model_name="none")
+    ev.add_kb_rule(kb_ref="KB_1", rule_summary="r", impact_on_answer="i")
+    ev.add_assumption(ref="A1", description="d")
+
+    out = ev.finalize()
+
+    assert out["data_used"] == [
+        {
+            "source_type": "telemetry",
+            "source_name": "v0",
+            "query": {"asset_id": "rack_01"},
+            "time_window": None,
+            "row_count": 3,
+            "quality_notes": "",
+        }
+    ]
+    assert out["computations"][0]["assumptions_refs"] == []
+    assert out["model_calls"][0]["inputs_summary"] == {}
+    assert out["kb_rules_applied"] == [{"kb_ref": "KB_1", "rule_summary": "r", "impact_on_answer": "i"}]
+    assert out["assumptions_and_gaps"]["assumptions"] == [{"ref": "A1", "description": "d"}]
+
+
+def test_evidence_id_and_generated_at_share_one_timestamp():
+    ev = EvidenceBuilder.start("q", "intent")
+    stamp = ev.generated_at[:19].replace("-", "").replace(":", "")
+
+    assert ev.evidence_id.startswith(f"ev_{stamp}Z_")
+    assert len(ev.evidence_id.rsplit("_", 1)[1]) == 8
+    assert EvidenceBuilder.start("q", "intent").evidence_id != ev.evidence_id
+    assert EvidenceBuilder(question="q", intent="i", evidence_id="ev_fixed").evidence_id == "ev_fixed"
+
+
+def test_new_evidence_stamp_matches_builder_format():
+    evidence_id, generated_at = new_evidence_stamp()
+    stamp = generated_at[:19].replace("-", "").replace(":", "")
+
+    assert evidence_id.startswith(f"ev_{stamp}Z_")
+    assert new_evidence_stamp()[0] != evidence_id
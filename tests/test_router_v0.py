@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import pytest
+
+from brain.router_v0 import _infer_intent
+
+
+@pytest.mark.parametrize(
+    "question, expected",
+    [
+        ("Why is rack_01 degrading?", "linked_degradation_v0"),
+        ("WHY did SoH drop", "linked_degradation_v0"),
+        ("Why is it overheating?", "anomaly_scan_temp_v0"),
+        ("Any thermal anomalies on rack_02?", "anomaly_scan_temp_v0"),
+        ("Did the temperature spike?", "anomaly_scan_temp_v0"),
+        ("Which rack is declining faster?", "soh_trend_compare_v0"),
+        ("Compare battery health", "soh_trend_compare_v0"),
+        ("", "soh_trend_compare_v0"),
+        (None, "soh_trend_compare_v0"),
+    ],
+)
+def test_infer_intent_keywords(question, expected):
+    assert _infer_intent(question) == expected
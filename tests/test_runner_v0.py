@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+import shutil
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from adapters.telemetry import CsvTelemetryAdapter
+from adapters.telemetry.csv_adapter import to_epoch_ns
+from brain import runner_v0
+from brain.confidence_bridge_v1 import gap_stats_from_flags
+from brain.runner_v0 import _asset_stats, clear_compare_cache, compare_soh_trend_v0
+
+T0 = datetime(2025, 12, 1, tzinfo=timezone.utc)
+DATA_DIR = Path(__file__).resolve().parents[1] / "synthetic_data" / "generated" / "v0"
+WINDOW = dict(
+    start_iso="2025-12-01T00:00:00+00:00",
+    end_iso="2025-12-15T00:00:00+00:00",
+    day7_boundary_iso="2025-12-08T00:00:00+00:00",
+)
+
+
+def test_asset_stats_fuses_gap_runs_and_boundary_slopes():
+    n = 96  # one day per side at 15m cadence
+    timestamps = [to_epoch_ns(T0 + timedelta(minutes=15 * i)) for i in range(2 * n)]
+    flags = ["ok"] * (2 * n)
+    for i in (5, 6, 7, 150):
+        flags[i] = "missing"
+    # pre: flat at 99.0; post: falls 0.5 per day
+    values = [None if dq == "missing" else (99.0 if i < n else 99.0 - 0.5 * (i - n) / n) for i, dq in enumerate(flags)]
+
+    pre_slope, post_slope, missing, streak_max, streaks = _asset_stats(timestamps, values, flags, timestamps[n])
+
+    assert pre_slope == 0.0
+    assert -0.5 < post_slope < -0.4  # head/tail means sit ~10% in from each end
+    assert {"missing_rows": missing, "missing_streak_max": streak_max, "missing_streaks": streaks} == (
+        gap_stats_from_flags(dq == "missing" for dq in flags)
+    )
+
+
+def test_asset_stats_needs_enough_points_per_side():
+    timestamps = [to_epoch_ns(T0 + timedelta(minutes=15 * i)) for i in range(30)]
+    values = [99.0] * 30
+
+    pre_slope, post_slope, *_ = _asset_stats(timestamps, values, ["ok"] * 30, timestamps[25])
+
+    assert pre_slope == 0.0
+    assert post_slope is None  # only 5 post-boundary points
+
+
+def test_compare_results_are_cached_with_fresh_audit_identity(monkeypatch):
+    clear_compare_cache()
+    adapter = CsvTelemetryAdapter(DATA_DIR)
+    now = [1000.0]
+    monkeypatch.setattr(runner_v0, "_clock", lambda: now[0])
+    calls = []
+    compute = runner_v0._compare_soh_trend
+    monkeypatch.setattr(runner_v0, "_compare_soh_trend", lambda *a, **kw: calls.append(1) or compute(*a, **kw))
+
+    first = compare_soh_trend_v0(adapter, ["rack_01", "rack_02"], **WINDOW)
+    first.data["winner"] = "caller mutation"
+    second = compare_soh_trend_v0(adapter, ["rack_01", "rack_02"], **WINDOW)
+
+    assert len(calls) == 1
+    assert second.data["winner"] == "rack_02"
+    assert second.evidence["evidence_id"] != first.evidence["evidence_id"]
+    assert second.evidence["data_used"] == first.evidence["data_used"]
+
+    # Expired entries are recomputed
+    now[0] += runner_v0.COMPARE_CACHE_TTL_S + 1
+    third = compare_soh_trend_v0(adapter, ["rack_01", "rack_02"], **WINDOW)
+    assert len(calls) == 2
+    assert third.to_dict(deep=True)["data"] == second.to_dict(deep=True)["data"]
+    clear_compare_cache()
+
+
+def test_compare_cache_misses_after_adapter_reload(tmp_path):
+    clear_compare_cache()
+    base = tmp_path / "v0"
+    shutil.copytree(DATA_DIR, base)
+    adapter = CsvTelemetryAdapter(base)
+
+    before = compare_soh_trend_v0(adapter, ["rack_01", "rack_02"], **WINDOW)
+    assert before.data["per_asset"]["rack_01"]["row_count"] == 1344
+
+    # Keep only the first 500 rack_01 rows and make the change visible to the stat check
+    telemetry = base / "telemetry.csv"
+    header, *rows = telemetry.read_text(encoding="utf-8").splitlines(keepends=True)
+    telemetry.write_text(header + "".join([r for r in rows if ",rack_01," in r][:500]), encoding="utf-8")
+    st = telemetry.stat()
+    os.utime(telemetry, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    after = compare_soh_trend_v0(adapter, ["rack_01", "rack_02"], **WINDOW)
+    assert after.data["per_asset"]["rack_01"]["row_count"] == 500
+    assert after.data["per_asset"]["rack_02"]["row_count"] == 0
+    clear_compare_cache()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from adapters.telemetry import CsvTelemetryAdapter
+from adapters.telemetry.csv_adapter import TimeWindow
+from brain import runner_v0
+from brain.anomaly_scan_v0 import anomaly_scan_v0
+from brain.runner_v0 import compare_soh_trend_v0
+from brain.telemetry_bundle_v0 import fetch_arrays
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "synthetic_data" / "generated" / "v0"
+START, END = "2025-12-01T00:00:00+00:00", "2025-12-15T00:00:00+00:00"
+
+
+class RowsOnlyAdapter:
+    """Adapter with only the required contract methods (no columnar variant)."""
+
+    def __init__(self, inner: CsvTelemetryAdapter) -> None:
+        self._inner = inner
+        self.base_dir = inner.base_dir
+
+    def get_timeseries(self, asset_id, signals, time_window=None):
+        return self._inner.get_timeseries(asset_id, signals, time_window)
+
+    def get_events(self, asset_id, time_window=None):
+        return self._inner.get_events(asset_id, time_window)
+
+    def get_asset_context(self, asset_id):
+        return self._inner.get_asset_context(asset_id)
+
+
+def test_fetch_arrays_builds_columns_from_rows_when_adapter_lacks_arrays():
+    adapter = CsvTelemetryAdapter(DATA_DIR)
+    tw = TimeWindow.from_iso(START, END)
+
+    native = fetch_arrays(adapter, "rack_02", ["soh", "temperature"], tw)
+    fallback = fetch_arrays(RowsOnlyAdapter(adapter), "rack_02", ["soh", "temperature"], tw)
+
+    assert fallback["row_count"] == native["row_count"]
+    assert fallback["time_window"] == native["time_window"]
+    for name, col in native["columns"].items():
+        assert list(fallback["columns"][name]) == list(col), name
+
+
+def test_anomaly_scan_runs_on_rows_only_adapter():
+    adapter = CsvTelemetryAdapter(DATA_DIR)
+
+    native = anomaly_scan_v0(adapter, "rack_02", start_iso=START, end_iso=END)
+    fallback = anomaly_scan_v0(RowsOnlyAdapter(adapter), "rack_02", start_iso=START, end_iso=END)
+
+    assert fallback.data == native.data
+
+
+def test_compare_runs_uncached_on_adapter_without_data_version(monkeypatch):
+    adapter = CsvTelemetryAdapter(DATA_DIR)
+    window = dict(start_iso=START, end_iso=END, day7_boundary_iso="2025-12-08T00:00:00+00:00")
+    calls = []
+    compute = runner_v0._compare_soh_trend
+    monkeypatch.setattr(runner_v0, "_compare_soh_trend", lambda *a, **kw: calls.append(1) or compute(*a, **kw))
+
+    rows_only = RowsOnlyAdapter(adapter)
+    first = compare_soh_trend_v0(rows_only, ["rack_01", "rack_02"], **window)
+    second = compare_soh_trend_v0(rows_only, ["rack_01", "rack_02"], **window)
+
+    assert len(calls) == 2  # no data version, no cache
+    assert first.data == second.data
+    assert first.data["winner"] == "rack_02"